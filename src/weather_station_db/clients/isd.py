@@ -8,7 +8,11 @@ import asyncio
 import csv
 import io
 import logging
-from dataclasses import dataclass
+import math
+from array import array
+from collections.abc import AsyncIterator, Collection, Iterable, Iterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
 import httpx
@@ -18,8 +22,58 @@ from ..schemas import DataSource, StationMetadata
 
 logger = logging.getLogger(__name__)
 
+# Parsed isd-history.csv row, in ISDStation field order
+StationFields = tuple[
+    str, str, str, str, str | None, float, float, float | None, str | None, str | None
+]
 
-@dataclass
+
+def _is_active(end_date: str | None, year: int) -> bool:
+    """Check an isd-history.csv END date against a year, with a 2 year grace period."""
+    if not end_date:
+        return True
+    try:
+        end_year = int(end_date[:4])
+        # Allow 2 year grace period for stations that may still be active
+        # but haven't been updated in the history file
+        return end_year >= (year - 2)
+    except (ValueError, IndexError):
+        return True
+
+
+class _StationRowReader:
+    """Turn isd-history.csv lines into rows keyed by the header line.
+
+    The first non-blank line is taken as the header. Lines can be fed one
+    at a time as they arrive, or read in bulk from an iterable.
+    """
+
+    __slots__ = ("header",)
+
+    def __init__(self) -> None:
+        self.header: list[str] | None = None
+
+    def _to_row(self, fields: list[str]) -> dict[str, str] | None:
+        if not fields:
+            return None
+        if self.header is None:
+            self.header = fields
+            return None
+        return dict(zip(self.header, fields, strict=False))
+
+    def feed(self, line: str) -> dict[str, str] | None:
+        """Return the row for one line, or None for the header or a blank line."""
+        return self._to_row(next(csv.reader((line,)), []))
+
+    def rows(self, lines: Iterable[str]) -> Iterator[dict[str, str]]:
+        """Yield the data rows of an iterable of lines."""
+        for fields in csv.reader(lines):
+            row = self._to_row(fields)
+            if row is not None:
+                yield row
+
+
+@dataclass(slots=True)
 class ISDStation:
     """Station metadata from isd-history.csv."""
 
@@ -46,15 +100,69 @@ class ISDStation:
         we consider stations active if their end_date is within 2 years
         of the requested year.
         """
-        if not self.end_date:
-            return True
-        try:
-            end_year = int(self.end_date[:4])
-            # Allow 2 year grace period for stations that may still be active
-            # but haven't been updated in the history file
-            return end_year >= (year - 2)
-        except (ValueError, IndexError):
-            return True
+        return _is_active(self.end_date, year)
+
+
+_STATION_FIELDS = frozenset(ISDStation.__dataclass_fields__)
+
+
+@dataclass(slots=True)
+class _ISDStationColumns:
+    """Column-oriented view of isd-history.csv.
+
+    Each attribute holds one column, with row i of every column describing
+    the same station. Coordinates are packed into float arrays; a missing
+    elevation is stored as NaN.
+    """
+
+    usaf: list[str] = field(default_factory=list)
+    wban: list[str] = field(default_factory=list)
+    name: list[str] = field(default_factory=list)
+    country: list[str] = field(default_factory=list)
+    state: list[str | None] = field(default_factory=list)
+    latitude: "array[float]" = field(default_factory=lambda: array("d"))
+    longitude: "array[float]" = field(default_factory=lambda: array("d"))
+    elevation_m: "array[float]" = field(default_factory=lambda: array("d"))
+    begin_date: list[str | None] = field(default_factory=list)
+    end_date: list[str | None] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.usaf)
+
+    def append(self, fields: StationFields) -> None:
+        """Append one parsed row to every column."""
+        usaf, wban, name, country, state, lat, lon, elev, begin, end = fields
+        self.usaf.append(usaf)
+        self.wban.append(wban)
+        self.name.append(name)
+        self.country.append(country)
+        self.state.append(state)
+        self.latitude.append(lat)
+        self.longitude.append(lon)
+        self.elevation_m.append(math.nan if elev is None else elev)
+        self.begin_date.append(begin)
+        self.end_date.append(end)
+
+    def materialize(self, indices: Iterable[int]) -> list[ISDStation]:
+        """Build ISDStation rows for the given indices only."""
+        stations: list[ISDStation] = []
+        for i in indices:
+            elev = self.elevation_m[i]
+            stations.append(
+                ISDStation(
+                    usaf=self.usaf[i],
+                    wban=self.wban[i],
+                    name=self.name[i],
+                    country=self.country[i],
+                    state=self.state[i],
+                    latitude=self.latitude[i],
+                    longitude=self.longitude[i],
+                    elevation_m=None if math.isnan(elev) else elev,
+                    begin_date=self.begin_date[i],
+                    end_date=self.end_date[i],
+                )
+            )
+        return stations
 
 
 class ISDClient:
@@ -97,16 +205,22 @@ class ISDClient:
             await self._http_client.aclose()
             self._http_client = None
 
-    async def _rate_limited_get(self, url: str) -> httpx.Response:
-        """Make a rate-limited GET request."""
+    @asynccontextmanager
+    async def _rate_limited_stream(self, url: str) -> AsyncIterator[httpx.Response]:
+        """Open a rate-limited streaming GET request."""
         async with self._request_semaphore:
-            response = await self.http_client.get(url)
-            await asyncio.sleep(self.config.request_delay_ms / 1000)
-            return response
+            try:
+                async with self.http_client.stream("GET", url) as response:
+                    yield response
+            finally:
+                await asyncio.sleep(self.config.request_delay_ms / 1000)
 
     async def get_station_list(self, use_cache: bool = True) -> list[ISDStation]:
         """Fetch and parse isd-history.csv.
 
+        The file is streamed and parsed line by line so the full body is
+        never held in memory as a single string.
+
         Args:
             use_cache: If True, return cached list if available.
 
@@ -119,62 +233,141 @@ class ISDClient:
         url = f"{self.config.base_url}/pub/data/noaa/isd-history.csv"
 
         try:
-            response = await self._rate_limited_get(url)
-            response.raise_for_status()
+            async with self._rate_limited_stream(url) as response:
+                response.raise_for_status()
+                stations = await self._parse_station_stream(response.aiter_lines())
         except httpx.HTTPError as e:
             logger.error("Failed to fetch ISD station list: %s", e)
             return []
 
-        stations = self._parse_station_list(response.text)
         self._station_cache = stations
         logger.info("Loaded %d stations from ISD history", len(stations))
         return stations
 
-    def _parse_station_list(self, content: str) -> list[ISDStation]:
+    async def _parse_station_stream(self, lines: AsyncIterator[str]) -> list[ISDStation]:
+        """Parse isd-history.csv lines as they arrive from the network."""
+        stations: list[ISDStation] = []
+        reader = _StationRowReader()
+        async for line in lines:
+            row = reader.feed(line)
+            if row is None:
+                continue
+            station = self._parse_station_row(row)
+            if station is not None:
+                stations.append(station)
+        return stations
+
+    def _parse_station_list(
+        self, content: str, columns: Collection[str] | None = None
+    ) -> list[ISDStation]:
         """Parse isd-history.csv content.
 
         CSV columns: USAF, WBAN, STATION NAME, CTRY, STATE, ICAO, LAT, LON, ELEV(M), BEGIN, END
+
+        Args:
+            content: CSV file content.
+            columns: ISDStation field names to parse. usaf, latitude and
+                longitude are always filled in; other fields not listed are
+                left empty. None parses every field.
+
+        Raises:
+            ValueError: If columns names a field ISDStation does not have.
         """
-        stations: list[ISDStation] = []
-        reader = csv.DictReader(io.StringIO(content))
+        return self._parse_station_list_chunked(io.StringIO(content), columns)
 
-        for row in reader:
-            try:
-                # Parse latitude/longitude
-                lat = self._parse_float(row.get("LAT", ""))
-                lon = self._parse_float(row.get("LON", ""))
-                elev = self._parse_float(row.get("ELEV(M)", ""))
-
-                station = ISDStation(
-                    usaf=row.get("USAF", "").strip(),
-                    wban=row.get("WBAN", "").strip(),
-                    name=row.get("STATION NAME", "").strip(),
-                    country=row.get("CTRY", "").strip(),
-                    state=row.get("STATE", "").strip() or None,
-                    latitude=lat,
-                    longitude=lon,
-                    elevation_m=elev,
-                    begin_date=row.get("BEGIN", "").strip() or None,
-                    end_date=row.get("END", "").strip() or None,
-                )
+    def _parse_station_list_chunked(
+        self, lines: Iterable[str], columns: Collection[str] | None = None
+    ) -> list[ISDStation]:
+        """Parse isd-history.csv from an iterable of lines.
 
-                # Skip stations without valid coordinates
-                # ISD uses -999 or similar for missing coordinates
-                if (
-                    station.usaf
-                    and lat is not None
-                    and lon is not None
-                    and -90 <= lat <= 90
-                    and -180 <= lon <= 180
-                ):
-                    stations.append(station)
-
-            except Exception as e:
-                logger.debug("Error parsing station row: %s", e)
-                continue
+        Only one row is held at a time, so memory use is bounded by the
+        number of valid stations rather than the size of the input.
+        """
+        if columns is not None:
+            unknown = set(columns) - _STATION_FIELDS
+            if unknown:
+                raise ValueError(f"Unknown ISDStation fields: {', '.join(sorted(unknown))}")
 
+        stations: list[ISDStation] = []
+        for row in _StationRowReader().rows(lines):
+            station = self._parse_station_row(row, columns)
+            if station is not None:
+                stations.append(station)
         return stations
 
+    def _parse_station_list_columnar(self, content: str) -> _ISDStationColumns:
+        """Parse isd-history.csv content into columns instead of row objects.
+
+        Use with _filter_stations_columnar() and _ISDStationColumns.materialize()
+        to build ISDStation objects only for the stations that are kept.
+        """
+        columns = _ISDStationColumns()
+        for row in _StationRowReader().rows(io.StringIO(content)):
+            parsed = self._parse_station_fields(row)
+            if parsed is not None:
+                columns.append(parsed)
+        return columns
+
+    def _parse_station_row(
+        self, row: dict[str, str], columns: Collection[str] | None = None
+    ) -> ISDStation | None:
+        """Parse a single isd-history.csv row, returning None if invalid."""
+        parsed = self._parse_station_fields(row, columns)
+        if parsed is None:
+            return None
+        return ISDStation(*parsed)
+
+    def _parse_station_fields(
+        self, row: dict[str, str], columns: Collection[str] | None = None
+    ) -> StationFields | None:
+        """Parse the fields of a single isd-history.csv row, returning None if invalid.
+
+        Rows are rejected on the cheap identifier and coordinate checks
+        before the remaining fields are parsed. When columns is given, only
+        those fields beyond the key fields are parsed; the rest are left as ""
+        for strings and None otherwise.
+        """
+        try:
+            key = self._parse_station_key(row)
+            if key is None:
+                return None
+            usaf, lat, lon = key
+
+            def wanted(name: str) -> bool:
+                return columns is None or name in columns
+
+            return (
+                usaf,
+                row.get("WBAN", "").strip() if wanted("wban") else "",
+                row.get("STATION NAME", "").strip() if wanted("name") else "",
+                row.get("CTRY", "").strip() if wanted("country") else "",
+                (row.get("STATE", "").strip() or None) if wanted("state") else None,
+                lat,
+                lon,
+                self._parse_float(row.get("ELEV(M)", "")) if wanted("elevation_m") else None,
+                (row.get("BEGIN", "").strip() or None) if wanted("begin_date") else None,
+                (row.get("END", "").strip() or None) if wanted("end_date") else None,
+            )
+        except Exception as e:
+            logger.debug("Error parsing station row: %s", e)
+            return None
+
+    def _parse_station_key(self, row: dict[str, str]) -> tuple[str, float, float] | None:
+        """Return (usaf, lat, lon) for a row, or None if it has no usable identity.
+
+        ISD uses -999 or similar for missing coordinates; such rows are skipped.
+        """
+        usaf = row.get("USAF", "").strip()
+        if not usaf:
+            return None
+        lat = self._parse_float(row.get("LAT", ""))
+        if lat is None or not -90 <= lat <= 90:
+            return None
+        lon = self._parse_float(row.get("LON", ""))
+        if lon is None or not -180 <= lon <= 180:
+            return None
+        return usaf, lat, lon
+
     def _parse_float(self, value: str) -> float | None:
         """Parse a float value, returning None for empty or invalid."""
         if not value or value.strip() in ("", "nan", "NaN"):
@@ -217,6 +410,36 @@ class ISDClient:
 
         return filtered
 
+    def _filter_stations_columnar(
+        self,
+        columns: _ISDStationColumns,
+        country_codes: list[str] | None = None,
+        station_ids: list[str] | None = None,
+        active_year: int | None = None,
+    ) -> list[int]:
+        """Filter a columnar station list, returning the indices of matching rows.
+
+        Takes the same criteria as filter_stations(), but each predicate reads
+        only the column it needs.
+        """
+        indices: Iterable[int] = range(len(columns))
+
+        if active_year:
+            end_dates = columns.end_date
+            indices = [i for i in indices if _is_active(end_dates[i], active_year)]
+
+        if country_codes:
+            codes_upper = {c.upper() for c in country_codes}
+            countries = columns.country
+            indices = [i for i in indices if countries[i].upper() in codes_upper]
+
+        if station_ids:
+            ids_set = set(station_ids)
+            usaf, wban = columns.usaf, columns.wban
+            indices = [i for i in indices if f"{usaf[i]}-{wban[i]}" in ids_set]
+
+        return list(indices)
+
     async def get_station_metadata(self, station: ISDStation) -> StationMetadata | None:
         """Convert ISDStation to StationMetadata schema.
 
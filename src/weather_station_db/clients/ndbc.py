@@ -1,6 +1,7 @@
 """NDBC (National Data Buoy Center) HTTP client."""
 
 import asyncio
+import io
 import logging
 import re
 from datetime import datetime, timezone
@@ -19,6 +20,13 @@ MISSING_VALUES = {"MM", "999", "9999", "99.0", "999.0", "9999.0"}
 # Nautical miles to meters conversion
 NM_TO_METERS = 1852
 
+# Patterns compiled once at import rather than looked up per call
+STATION_ID_RE = re.compile(r"^[A-Za-z0-9]{4,6}$")
+LATITUDE_RE = re.compile(r"(\d+\.\d+)\s*[°]?\s*[NS]")
+LONGITUDE_RE = re.compile(r"(\d+\.\d+)\s*[°]?\s*[WE]")
+COORDINATES_RE = re.compile(r"(\d+\.\d+)\s*[NS]\s+(\d+\.\d+)\s*[WE]")
+STATION_NAME_RE = re.compile(r"<h1[^>]*>([^<]+)</h1>")
+
 
 class NDBCClient:
     """HTTP client for fetching data from NDBC."""
@@ -31,6 +39,8 @@ class NDBCClient:
         self.config = config or NDBCConfig()
         self._http_client = http_client
         self._request_semaphore = asyncio.Semaphore(self.config.max_concurrent)
+        # Parsed station pages keyed by station ID, with a hash of the page content
+        self._metadata_cache: dict[str, tuple[str, StationMetadata | None]] = {}
 
     @property
     def http_client(self) -> httpx.AsyncClient:
@@ -91,12 +101,11 @@ class NDBCClient:
             if line.startswith("Station") or "|" not in line:
                 continue
 
-            parts = line.split("|")
-            if parts:
-                station_id = parts[0].strip()
-                # Valid station IDs are typically 5 alphanumeric characters
-                if station_id and re.match(r"^[A-Za-z0-9]{4,6}$", station_id):
-                    station_ids.append(station_id.lower())
+            # Only the first column is needed, so avoid splitting the whole row
+            station_id = line[: line.index("|")].strip()
+            # Valid station IDs are typically 5 alphanumeric characters
+            if station_id and STATION_ID_RE.match(station_id):
+                station_ids.append(station_id.lower())
 
         logger.info("Found %d active stations", len(station_ids))
         return station_ids
@@ -120,15 +129,33 @@ class NDBCClient:
     def _parse_station_metadata(self, station_id: str, content: str) -> StationMetadata | None:
         """Parse station page HTML to extract metadata.
 
+        Parsed results are cached per station and reused while the page
+        content is unchanged, so polling an unchanged page skips the regex
+        parse. Each call still gets a fresh updated_at.
+        """
+        cached = self._metadata_cache.get(station_id)
+        if cached is not None and cached[0] == content:
+            metadata = cached[1]
+            if metadata is None:
+                return None
+            return metadata.model_copy(update={"updated_at": datetime.now(timezone.utc)})
+
+        metadata = self._parse_station_page(station_id, content)
+        self._metadata_cache[station_id] = (content, metadata)
+        return metadata
+
+    def _parse_station_page(self, station_id: str, content: str) -> StationMetadata | None:
+        """Parse station page HTML.
+
         This is a simplified parser that extracts key fields from the HTML.
         """
         # Extract coordinates from meta tags or content
-        lat_match = re.search(r"(\d+\.\d+)\s*[°]?\s*[NS]", content)
-        lon_match = re.search(r"(\d+\.\d+)\s*[°]?\s*[WE]", content)
+        lat_match = LATITUDE_RE.search(content)
+        lon_match = LONGITUDE_RE.search(content)
 
         if not lat_match or not lon_match:
             # Try alternate format
-            coord_match = re.search(r"(\d+\.\d+)\s*[NS]\s+(\d+\.\d+)\s*[WE]", content)
+            coord_match = COORDINATES_RE.search(content)
             if coord_match:
                 lat = float(coord_match.group(1))
                 lon = float(coord_match.group(2))
@@ -148,7 +175,7 @@ class NDBCClient:
                 lon = -lon
 
         # Extract station name
-        name_match = re.search(r"<h1[^>]*>([^<]+)</h1>", content)
+        name_match = STATION_NAME_RE.search(content)
         name = name_match.group(1).strip() if name_match else None
 
         return StationMetadata(
@@ -180,31 +207,41 @@ class NDBCClient:
             logger.warning("Failed to fetch observation for station %s: %s", station_id, e)
             return None
 
-        return self._parse_realtime_observation(station_id, response.text)
+        return self._parse_realtime_observation(station_id, response.content)
 
-    def _parse_realtime_observation(self, station_id: str, content: str) -> Observation | None:
+    def _parse_realtime_observation(
+        self, station_id: str, content: str | bytes
+    ) -> Observation | None:
         """Parse realtime2 data file and extract latest observation.
 
         Format is space-separated with two header rows:
         #YY  MM DD hh mm WDIR WSPD GST  WVHT   DPD   APD MWD   PRES  ATMP ...
         #yr  mo dy hr mn degT m/s  m/s     m   sec   sec degT   hPa  degC ...
         2024 01 15 12 00  270  5.1  7.2   1.8  12.5   MM  MM 1018.5 ...
+
+        Only the first (most recent) data line is used, so scanning stops
+        there. Raw bytes are accepted so that only that line is decoded.
         """
-        lines = content.strip().split("\n")
+        line = self._first_data_line(content)
 
-        # Find data lines (skip header lines starting with #)
-        data_lines: list[str] = []
+        if line is None:
+            logger.warning("No observation data found for station %s", station_id)
+            return None
 
-        for line in lines:
-            if not line.startswith("#") and line.strip():
-                data_lines.append(line)
+        return self._parse_observation_line(station_id, line)
 
-        if not data_lines:
-            logger.warning("No observation data found for station %s", station_id)
+    def _first_data_line(self, content: str | bytes) -> str | None:
+        """Return the first non-empty line that is not a # header."""
+        if isinstance(content, bytes):
+            for raw in io.BytesIO(content):
+                if raw.strip() and not raw.startswith(b"#"):
+                    return raw.decode("ascii", errors="replace").rstrip()
             return None
 
-        # Parse the first (most recent) data line
-        return self._parse_observation_line(station_id, data_lines[0])
+        for line in io.StringIO(content):
+            if line.strip() and not line.startswith("#"):
+                return line.rstrip()
+        return None
 
     def _parse_observation_line(self, station_id: str, line: str) -> Observation | None:
         """Parse a single observation line from realtime2 data."""
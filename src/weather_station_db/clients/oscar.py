@@ -201,8 +201,6 @@ class OSCARClient:
 
     def _parse_station_list(self, data: Any) -> list[OSCARStation]:
         """Parse station list from API response."""
-        stations: list[OSCARStation] = []
-
         # Handle different response formats
         items: list[Any]
         if isinstance(data, list):
@@ -216,12 +214,17 @@ class OSCARClient:
         else:
             return []
 
-        for item in items:
-            station = OSCARStation.from_api_response(item)
-            if station and station.latitude is not None and station.longitude is not None:
-                stations.append(station)
-
-        return stations
+        # Check raw coordinates first so rows without them are never built
+        from_api_response = OSCARStation.from_api_response
+        return [
+            station
+            for item in items
+            if item.get("latitude") is not None
+            and item.get("longitude") is not None
+            and (station := from_api_response(item)) is not None
+            and station.latitude is not None
+            and station.longitude is not None
+        ]
 
     async def search_stations(
         self,
@@ -232,8 +232,12 @@ async def run_all_producers(
     logger.info("All producers stopped")
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command line arguments."""
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments.
+
+    Args:
+        argv: Arguments to parse. Defaults to sys.argv[1:].
+    """
     parser = argparse.ArgumentParser(
         description="Weather Station Data Platform - Data Producers",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -299,7 +303,7 @@ Producer Configuration:
         version="%(prog)s 0.1.0",
     )
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
 def main() -> NoReturn:
@@ -1,17 +1,18 @@
 """Kafka writer for weather station data."""
 
 import logging
-from typing import Callable, Protocol
-
-from confluent_kafka import KafkaError, Message, Producer
+from typing import TYPE_CHECKING, Callable, Protocol
 
 from ..config import KafkaConfig
 from ..schemas import Observation, StationMetadata
 
+if TYPE_CHECKING:
+    from confluent_kafka import KafkaError, Message
+
 logger = logging.getLogger(__name__)
 
 # Type alias for delivery callback
-DeliveryCallback = Callable[[KafkaError | None, Message], None]
+DeliveryCallback = Callable[["KafkaError | None", "Message"], None]
 
 
 class KafkaProducerProtocol(Protocol):
@@ -57,6 +58,8 @@ class KafkaWriter:
     def producer(self) -> KafkaProducerProtocol:
         """Lazy-initialize Kafka producer."""
         if self._producer is None:
+            from confluent_kafka import Producer
+
             self._producer = Producer(  # type: ignore[assignment]
                 {
                     "bootstrap.servers": self.config.bootstrap_servers,
@@ -65,7 +68,7 @@ class KafkaWriter:
         assert self._producer is not None
         return self._producer
 
-    def _delivery_callback(self, err: KafkaError | None, msg: Message) -> None:
+    def _delivery_callback(self, err: "KafkaError | None", msg: "Message") -> None:
         """Callback for Kafka delivery reports."""
         if err is not None:
             logger.error("Kafka delivery failed: %s", err)
@@ -1,7 +1,27 @@
 """Shared test fixtures for all tests."""
 
+import functools
+from collections.abc import Callable
+from pathlib import Path
+
 import pytest
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def load_fixture() -> Callable[[str], str]:
+    """Load a fixture file by path relative to tests/fixtures.
+
+    Each file is read at most once per session, and only when a test asks for it.
+    """
+
+    @functools.cache
+    def _load(name: str) -> str:
+        return (FIXTURES_DIR / name).read_text()
+
+    return _load
+
 
 @pytest.fixture
 def sample_station_id() -> str:
@@ -0,0 +1,142 @@
+"""OSCAR API sample payloads as Python literals.
+
+Mirrors the JSON files in this directory so tests import the data instead of
+reading and parsing it. Keep both in sync when editing either.
+"""
+
+from typing import Any
+
+APPROVED_STATIONS: list[dict[str, Any]] = [
+    {
+        "wigosStationIdentifier": "0-20000-0-72053",
+        "name": "NEW YORK CITY CENTRAL PARK",
+        "latitude": 40.779,
+        "longitude": -73.969,
+        "elevation": 47.5,
+        "territory": {"countryCode": "US", "name": "United States of America"},
+        "region": "North America",
+        "stationClass": "synoptic",
+        "facilityType": "Land fixed",
+        "supervisionOrganization": {"name": "National Weather Service", "acronym": "NWS"},
+        "stationStatus": "operational",
+    },
+    {
+        "wigosStationIdentifier": "0-20000-0-72503",
+        "name": "JOHN F KENNEDY INTL AIRPORT",
+        "latitude": 40.639,
+        "longitude": -73.762,
+        "elevation": 3.9,
+        "territory": {"countryCode": "US", "name": "United States of America"},
+        "region": "North America",
+        "stationClass": "synoptic",
+        "facilityType": "Land fixed",
+        "supervisionOrganization": {"name": "National Weather Service", "acronym": "NWS"},
+        "stationStatus": "operational",
+    },
+    {
+        "wigosStationIdentifier": "0-20000-0-07156",
+        "name": "PARIS ORLY",
+        "latitude": 48.727,
+        "longitude": 2.4,
+        "elevation": 89.0,
+        "territory": {"countryCode": "FR", "name": "France"},
+        "region": "Europe",
+        "stationClass": "synoptic",
+        "facilityType": "Land fixed",
+        "supervisionOrganization": {"name": "Météo-France"},
+        "stationStatus": "operational",
+    },
+    {
+        "wigosStationIdentifier": "0-20000-0-89009",
+        "name": "AMUNDSEN-SCOTT",
+        "latitude": -90.0,
+        "longitude": 0.0,
+        "elevation": 2835.0,
+        "territory": {"countryCode": "AQ", "name": "Antarctica"},
+        "region": "Antarctica",
+        "stationClass": "climatological",
+        "facilityType": "Land fixed",
+        "supervisionOrganization": {"name": "National Science Foundation", "acronym": "NSF"},
+        "stationStatus": "operational",
+    },
+    {
+        "wigosStationIdentifier": "0-20000-0-62001",
+        "name": "BUOY 62001",
+        "latitude": 45.2,
+        "longitude": -15.8,
+        "elevation": 0,
+        "territory": {"countryCode": None, "name": "International Waters"},
+        "region": "Atlantic Ocean",
+        "stationClass": "oceanographic",
+        "facilityType": "Sea fixed",
+        "supervisionOrganization": {
+            "name": "European Organization for the Exploitation of " "Meteorological Satellites",
+            "acronym": "EUMETSAT",
+        },
+        "stationStatus": "operational",
+    },
+]
+
+STATION_DETAIL: dict[str, Any] = {
+    "wigosStationIdentifier": "0-20000-0-72053",
+    "wmoIndexNumber": "72053",
+    "name": "NEW YORK CITY CENTRAL PARK",
+    "latitude": 40.779,
+    "longitude": -73.969,
+    "elevation": 47.5,
+    "territory": {"countryCode": "US", "name": "United States of America", "isoCode": "USA"},
+    "region": "North America",
+    "stationClass": "synoptic",
+    "facilityType": "Land fixed",
+    "supervisionOrganization": {
+        "name": "National Weather Service",
+        "acronym": "NWS",
+        "country": "United States of America",
+    },
+    "stationStatus": "operational",
+    "dateEstablished": "1869-01-01",
+    "programAffiliations": ["GOS", "GCOS", "RBCN"],
+    "observingCapabilities": [
+        {"name": "Air temperature", "unit": "K"},
+        {"name": "Relative humidity", "unit": "%"},
+        {"name": "Wind speed", "unit": "m/s"},
+    ],
+}
+
+SEARCH_RESULTS: dict[str, Any] = {
+    "stationSearchResults": [
+        {
+            "wigosStationIdentifier": "0-20000-0-72053",
+            "name": "NEW YORK CITY CENTRAL PARK",
+            "latitude": 40.779,
+            "longitude": -73.969,
+            "elevation": 47.5,
+            "territory": {"countryCode": "US", "name": "United States of America"},
+            "stationClass": "synoptic",
+            "facilityType": "Land fixed",
+            "stationStatus": "operational",
+        },
+        {
+            "wigosStationIdentifier": "0-20000-0-72503",
+            "name": "JOHN F KENNEDY INTL AIRPORT",
+            "latitude": 40.639,
+            "longitude": -73.762,
+            "elevation": 3.9,
+            "territory": {"countryCode": "US", "name": "United States of America"},
+            "stationClass": "synoptic",
+            "facilityType": "Land fixed",
+            "stationStatus": "operational",
+        },
+    ]
+}
+
+STATION_MISSING_COORDS: dict[str, Any] = {
+    "wigosStationIdentifier": "0-99999-0-00000",
+    "name": "INVALID STATION",
+    "latitude": None,
+    "longitude": None,
+    "elevation": None,
+    "territory": {"countryCode": None, "name": None},
+    "stationClass": None,
+    "stationStatus": "closed",
+}
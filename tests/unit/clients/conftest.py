@@ -0,0 +1,74 @@
+"""Shared fixtures for client tests."""
+
+import functools
+from collections.abc import AsyncIterator, Callable
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from tests.fixtures.oscar import data as oscar_data
+from weather_station_db.clients.oscar import OSCARClient, OSCARStation
+from weather_station_db.config import OSCARConfig
+
+
+@pytest.fixture(scope="session")
+def oscar_config() -> OSCARConfig:
+    """OSCAR configuration for testing."""
+    return OSCARConfig(
+        base_url="https://oscar.wmo.int/surface/rest/api",
+        api_timeout_seconds=30,
+    )
+
+
+@pytest.fixture(scope="session")
+def approved_stations_data() -> list:
+    """Approved stations fixture."""
+    return oscar_data.APPROVED_STATIONS
+
+
+@pytest.fixture(scope="session")
+def station_detail_data() -> dict:
+    """Station detail fixture."""
+    return oscar_data.STATION_DETAIL
+
+
+@pytest.fixture(scope="session")
+def search_results_data() -> dict:
+    """Search results fixture."""
+    return oscar_data.SEARCH_RESULTS
+
+
+@pytest.fixture(scope="session")
+def station_missing_coords_data() -> dict:
+    """Station with missing coordinates fixture."""
+    return oscar_data.STATION_MISSING_COORDS
+
+
+@pytest_asyncio.fixture(scope="module")
+async def oscar_client(oscar_config: OSCARConfig) -> AsyncIterator[OSCARClient]:
+    """OSCAR client for testing, closed when the module finishes."""
+    client = OSCARClient(config=oscar_config)
+    yield client
+    await client.close()
+
+
+@pytest.fixture(scope="session")
+def parsed_stations() -> list[OSCARStation]:
+    """Approved stations fixture, parsed once per session."""
+    return OSCARClient()._parse_station_list(oscar_data.APPROVED_STATIONS)
+
+
+@pytest.fixture(scope="session")
+def http_response(load_fixture: Callable[[str], str]) -> Callable[..., httpx.Response]:
+    """Return a shared HTTP response for a status and optional fixture file body.
+
+    respx clones a response for every matched request, so each response is
+    built once per session and can be handed to any number of routes.
+    """
+
+    @functools.cache
+    def _response(status: int, fixture: str | None = None) -> httpx.Response:
+        return httpx.Response(status, text=load_fixture(fixture) if fixture else "")
+
+    return _response
@@ -0,0 +1,113 @@
+"""Table-driven HTTP tests for the ISD and NDBC clients.
+
+Each endpoint scenario is its own parametrized item, so the cases spread
+evenly across workers under pytest-xdist.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from weather_station_db.clients.isd import ISDClient
+from weather_station_db.clients.ndbc import NDBCClient
+from weather_station_db.config import ISDConfig, NDBCConfig
+
+ISD_HISTORY_URL = "https://www.ncei.noaa.gov/pub/data/noaa/isd-history.csv"
+NDBC_STATION_TABLE_URL = "https://www.ndbc.noaa.gov/data/stations/station_table.txt"
+NDBC_REALTIME_URL = "https://www.ndbc.noaa.gov/data/realtime2/{}.txt"
+
+# (client factory, URL, client method, method args, status, fixture file, result check)
+HTTP_CASES = [
+    pytest.param(
+        lambda: ISDClient(config=ISDConfig(request_delay_ms=0)),
+        ISD_HISTORY_URL,
+        "get_station_list",
+        (),
+        200,
+        "isd/isd-history-sample.csv",
+        lambda stations: len(stations) == 4,
+        id="isd_stations",
+    ),
+    pytest.param(
+        lambda: ISDClient(config=ISDConfig(request_delay_ms=0)),
+        ISD_HISTORY_URL,
+        "get_station_list",
+        (),
+        500,
+        None,
+        lambda stations: stations == [],
+        id="isd_stations_http_error",
+    ),
+    pytest.param(
+        lambda: NDBCClient(config=NDBCConfig(request_delay_ms=0)),
+        NDBC_STATION_TABLE_URL,
+        "get_active_stations",
+        (),
+        200,
+        "ndbc/station_table.txt",
+        lambda stations: len(stations) == 5 and "46025" in stations,
+        id="ndbc_stations",
+    ),
+    pytest.param(
+        lambda: NDBCClient(config=NDBCConfig(request_delay_ms=0)),
+        NDBC_STATION_TABLE_URL,
+        "get_active_stations",
+        (),
+        500,
+        None,
+        lambda stations: stations == [],
+        id="ndbc_stations_http_error",
+    ),
+    pytest.param(
+        lambda: NDBCClient(config=NDBCConfig(request_delay_ms=0)),
+        NDBC_REALTIME_URL.format("46025"),
+        "get_latest_observation",
+        ("46025",),
+        200,
+        "ndbc/46025.txt",
+        lambda obs: (
+            obs is not None and obs.source_station_id == "46025" and obs.wind_speed_mps == 5.1
+        ),
+        id="ndbc_latest_observation",
+    ),
+    pytest.param(
+        lambda: NDBCClient(config=NDBCConfig(request_delay_ms=0)),
+        NDBC_REALTIME_URL.format("99999"),
+        "get_latest_observation",
+        ("99999",),
+        404,
+        None,
+        lambda obs: obs is None,
+        id="ndbc_latest_observation_404",
+    ),
+]
+
+
+@respx.mock
+@pytest.mark.parametrize(
+    "make_client,url,method,args,status,fixture,check",
+    HTTP_CASES,
+)
+async def test_http_endpoint(
+    make_client: Callable[[], ISDClient | NDBCClient],
+    url: str,
+    method: str,
+    args: tuple[str, ...],
+    status: int,
+    fixture: str | None,
+    check: Callable[[Any], bool],
+    http_response: Callable[..., httpx.Response],
+):
+    """Test a client endpoint against a mocked HTTP response."""
+    respx.get(url).mock(return_value=http_response(status, fixture))
+
+    client = make_client()
+    try:
+        result = await getattr(client, method)(*args)
+    finally:
+        await client.close()
+
+    assert check(result)
@@ -4,19 +4,18 @@ Note: ISD is now metadata-only. Observation functionality was removed.
 Use NWS or Open-Meteo clients for real-time observations.
 """
 
-from datetime import datetime, timezone
-from pathlib import Path
+import tracemalloc
+from collections.abc import AsyncIterator, Callable, Iterator
 
 import httpx
 import pytest
 import respx
 
-from weather_station_db.clients.isd import ISDClient, ISDStation
+from weather_station_db.clients import isd
+from weather_station_db.clients.isd import ISDClient, ISDStation, _ISDStationColumns
 from weather_station_db.config import ISDConfig
 from weather_station_db.schemas import DataSource
 
-FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures" / "isd"
-
 
 @pytest.fixture
 def isd_config() -> ISDConfig:
@@ -35,9 +34,9 @@ def isd_client(isd_config: ISDConfig) -> ISDClient:
 
 
 @pytest.fixture
-def station_history_content() -> str:
-    """Load station history fixture."""
-    return (FIXTURES_DIR / "isd-history-sample.csv").read_text()
+def station_history_content(load_fixture: Callable[[str], str]) -> str:
+    """Sample isd-history.csv content."""
+    return load_fixture("isd/isd-history-sample.csv")
 
 
 @pytest.fixture
@@ -79,6 +78,11 @@ class TestISDStation:
         assert sample_station.is_active(2025) is True
         assert sample_station.is_active(2026) is True
 
+    def test_uses_slots(self, sample_station: ISDStation):
+        """Test ISDStation has no per-instance __dict__."""
+        assert not hasattr(sample_station, "__dict__")
+        assert "latitude" in ISDStation.__slots__
+
     def test_is_active_no_end_date(self):
         """Test is_active when no end date."""
         station = ISDStation(
@@ -129,6 +133,127 @@ class TestParseStationList:
         stations = isd_client._parse_station_list("")
         assert stations == []
 
+    def test_parse_station_list_selective(
+        self, isd_client: ISDClient, station_history_content: str
+    ):
+        """Test that only the requested columns are parsed."""
+        stations = isd_client._parse_station_list(
+            station_history_content, columns={"usaf", "wban", "country"}
+        )
+
+        station = next(s for s in stations if s.usaf == "720534")
+        assert station.station_id == "720534-00164"
+        assert station.country == "US"
+        # Coordinates are parsed to validate the row, so they are kept
+        assert station.latitude == pytest.approx(40.779)
+        assert station.elevation_m is None
+        assert station.name == ""
+
+    def test_parse_station_list_selective_rejects_unknown_columns(self, isd_client: ISDClient):
+        """Test that a misspelled column name is an error rather than ignored."""
+        with pytest.raises(ValueError, match="countries"):
+            isd_client._parse_station_list("", columns={"usaf", "countries"})
+
+    def test_parse_station_list_selective_filters_by_country(
+        self, isd_client: ISDClient, station_history_content: str
+    ):
+        """Test a selective parse is enough for filtering by country."""
+        stations = isd_client._parse_station_list(
+            station_history_content, columns={"usaf", "wban", "country"}
+        )
+        filtered = isd_client.filter_stations(stations, country_codes=["US"])
+
+        assert len(filtered) == 3
+
+    def test_parse_station_list_selective_keeps_same_rows(
+        self, isd_client: ISDClient, station_history_content: str
+    ):
+        """Test a selective parse rejects the same rows as a full parse."""
+        selective = isd_client._parse_station_list(
+            station_history_content, columns={"usaf", "wban", "country"}
+        )
+        full = isd_client._parse_station_list(station_history_content)
+
+        assert {s.station_id for s in selective} == {s.station_id for s in full}
+        assert "999999-99999" not in {s.station_id for s in selective}
+
+    def test_parse_chunked_matches_string(
+        self, isd_client: ISDClient, station_history_content: str
+    ):
+        """Test parsing from a line iterator gives the same result as a string."""
+        lines = iter(station_history_content.splitlines(keepends=True))
+        stations = isd_client._parse_station_list_chunked(lines)
+
+        assert stations == isd_client._parse_station_list(station_history_content)
+
+    async def test_parse_stream_matches_string(
+        self, isd_client: ISDClient, station_history_content: str
+    ):
+        """Test the streaming parser used by get_station_list matches a string parse."""
+
+        async def lines() -> AsyncIterator[str]:
+            for line in station_history_content.splitlines():
+                yield line
+
+        stations = await isd_client._parse_station_stream(lines())
+
+        assert stations == isd_client._parse_station_list(station_history_content)
+
+    def test_parse_chunked_bounded_memory(self, isd_client: ISDClient):
+        """Test that chunked parsing does not buffer the whole input."""
+
+        def synthetic_rows() -> Iterator[str]:
+            yield (
+                '"USAF","WBAN","STATION NAME","CTRY","STATE","ICAO",'
+                '"LAT","LON","ELEV(M)","BEGIN","END"\n'
+            )
+            for i in range(100_000):
+                # Missing coordinates so no rows are retained in the result
+                yield f'"{i:06d}","99999","SYNTHETIC","US","","","-999","-999","","",""\n'
+
+        tracemalloc.start()
+        try:
+            stations = isd_client._parse_station_list_chunked(synthetic_rows())
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert stations == []
+        assert peak < 5 * 1024 * 1024
+
+    def test_parse_skips_invalid_rows_before_parsing(
+        self, isd_client: ISDClient, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that rows without coordinates are rejected before full parsing."""
+        header = (
+            '"USAF","WBAN","STATION NAME","CTRY","STATE","ICAO",'
+            '"LAT","LON","ELEV(M)","BEGIN","END"\n'
+        )
+        invalid = [
+            f'"{i:06d}","99999","NO COORDS","US","","","","","","",""\n' for i in range(10_000)
+        ]
+        valid = [
+            f'"72{i:04d}","99999","VALID","US","NY","","+40.779","-073.969","+0047.5","",""\n'
+            for i in range(10)
+        ]
+        content = header + "".join(invalid) + "".join(valid)
+
+        calls = 0
+        parse_float = isd_client._parse_float
+
+        def counting_parse_float(value: str) -> float | None:
+            nonlocal calls
+            calls += 1
+            return parse_float(value)
+
+        monkeypatch.setattr(isd_client, "_parse_float", counting_parse_float)
+
+        stations = isd_client._parse_station_list(content)
+
+        assert len(stations) == 10
+        # One LAT parse per rejected row, full parse only for valid rows
+        assert calls == 10_000 + 3 * 10
+
 
 class TestFilterStations:
     def test_filter_by_country(self, isd_client: ISDClient, station_history_content: str):
@@ -167,8 +292,55 @@ class TestFilterStations:
         assert len(filtered) == 4
 
 
+class TestColumnarStationList:
+    def test_columnar_parse_shapes(self, isd_client: ISDClient, station_history_content: str):
+        """Test columnar parse produces one entry per valid station in every column."""
+        cols = isd_client._parse_station_list_columnar(station_history_content)
+
+        assert isinstance(cols, _ISDStationColumns)
+        assert len(cols) == 4
+        assert cols.latitude.typecode == "d"
+        assert len(cols.latitude) == len(cols.longitude) == len(cols.usaf) == 4
+
+    def test_columnar_materialize_matches_row_parse(
+        self, isd_client: ISDClient, station_history_content: str
+    ):
+        """Test materializing every row gives the same stations as the row parser."""
+        cols = isd_client._parse_station_list_columnar(station_history_content)
+
+        assert cols.materialize(range(len(cols))) == isd_client._parse_station_list(
+            station_history_content
+        )
+
+    def test_columnar_filter_by_country_ids(
+        self, isd_client: ISDClient, station_history_content: str
+    ):
+        """Test columnar filtering returns indices and only those rows are built."""
+        cols = isd_client._parse_station_list_columnar(station_history_content)
+        indices = isd_client._filter_stations_columnar(cols, country_codes=["US"])
+
+        assert len(indices) == 3
+        stations = cols.materialize(indices)
+        assert all(s.country == "US" for s in stations)
+
+    def test_columnar_filter_matches_row_filter(
+        self, isd_client: ISDClient, station_history_content: str
+    ):
+        """Test columnar filtering selects the same stations as filter_stations."""
+        cols = isd_client._parse_station_list_columnar(station_history_content)
+        stations = isd_client._parse_station_list(station_history_content)
+        criteria = {
+            "country_codes": ["US", "FR"],
+            "station_ids": ["720534-00164", "725090-14732"],
+            "active_year": 2024,
+        }
+
+        indices = isd_client._filter_stations_columnar(cols, **criteria)
+
+        assert cols.materialize(indices) == isd_client.filter_stations(stations, **criteria)
+
+
 class TestStationMetadata:
-    @pytest.mark.asyncio
     async def test_get_station_metadata(self, isd_client: ISDClient, sample_station: ISDStation):
         """Test converting ISDStation to StationMetadata."""
         metadata = await isd_client.get_station_metadata(sample_station)
@@ -183,7 +355,6 @@ class TestStationMetadata:
         assert metadata.country_code == "US"
         assert metadata.state_province == "NY"
 
-    @pytest.mark.asyncio
     async def test_get_station_metadata_no_coords(self, isd_client: ISDClient):
         """Test metadata returns None when no coordinates."""
         station = ISDStation(
@@ -205,25 +376,12 @@ class TestStationMetadata:
 
 class TestHTTPRequests:
     @respx.mock
-    @pytest.mark.asyncio
-    async def test_get_station_list(self, isd_client: ISDClient, station_history_content: str):
-        """Test fetching station list via HTTP."""
-        respx.get("https://www.ncei.noaa.gov/pub/data/noaa/isd-history.csv").mock(
-            return_value=httpx.Response(200, text=station_history_content)
-        )
-
-        stations = await isd_client.get_station_list()
-
-        assert len(stations) == 4
-
-    @respx.mock
-    @pytest.mark.asyncio
     async def test_get_station_list_caches(
-        self, isd_client: ISDClient, station_history_content: str
+        self, isd_client: ISDClient, http_response: Callable[..., httpx.Response]
     ):
         """Test that station list is cached."""
         route = respx.get("https://www.ncei.noaa.gov/pub/data/noaa/isd-history.csv").mock(
-            return_value=httpx.Response(200, text=station_history_content)
+            return_value=http_response(200, "isd/isd-history-sample.csv")
         )
 
         # First call
@@ -231,22 +389,35 @@ class TestHTTPRequests:
         # Second call should use cache
         stations2 = await isd_client.get_station_list()
 
-        assert len(stations1) == len(stations2)
+        assert stations1 is stations2
+        assert stations1[0] is stations2[0]
+        assert isd_client._station_cache is stations1
         assert route.call_count == 1  # Only one HTTP request
 
     @respx.mock
-    @pytest.mark.asyncio
-    async def test_get_station_list_http_error(self, isd_client: ISDClient):
-        """Test handling HTTP error when fetching stations."""
+    async def test_error_response_is_still_rate_limited(
+        self,
+        isd_client: ISDClient,
+        http_response: Callable[..., httpx.Response],
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test the request delay applies even when the response is an error."""
+        delays: list[float] = []
+
+        async def record_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr(isd.asyncio, "sleep", record_sleep)
         respx.get("https://www.ncei.noaa.gov/pub/data/noaa/isd-history.csv").mock(
-            return_value=httpx.Response(500)
+            return_value=http_response(500)
         )
 
         stations = await isd_client.get_station_list(use_cache=False)
+
         assert stations == []
+        assert delays == [isd_client.config.request_delay_ms / 1000]
 
     @respx.mock
-    @pytest.mark.asyncio
     async def test_client_close(self, isd_config: ISDConfig):
         """Test client close method."""
         client = ISDClient(config=isd_config)
@@ -1,17 +1,19 @@
 """Unit tests for NDBC client."""
 
-from pathlib import Path
+import asyncio
+import re
+from collections.abc import Callable
+from datetime import datetime, timezone, tzinfo
 
 import httpx
 import pytest
 import respx
 
+from weather_station_db.clients import ndbc
 from weather_station_db.clients.ndbc import NDBCClient
 from weather_station_db.config import NDBCConfig
 from weather_station_db.schemas import DataSource
 
-FIXTURES_DIR = Path(__file__).parent.parent.parent / "fixtures" / "ndbc"
-
 
 @pytest.fixture
 def ndbc_config() -> NDBCConfig:
@@ -30,33 +32,33 @@ def ndbc_client(ndbc_config: NDBCConfig) -> NDBCClient:
 
 
 @pytest.fixture
-def station_table_content() -> str:
-    """Load station table fixture."""
-    return (FIXTURES_DIR / "station_table.txt").read_text()
+def station_table_content(load_fixture: Callable[[str], str]) -> str:
+    """Sample station_table.txt content."""
+    return load_fixture("ndbc/station_table.txt")
 
 
 @pytest.fixture
-def observation_content() -> str:
-    """Load observation fixture."""
-    return (FIXTURES_DIR / "46025.txt").read_text()
+def observation_content(load_fixture: Callable[[str], str]) -> str:
+    """Sample realtime2 observation for station 46025."""
+    return load_fixture("ndbc/46025.txt")
 
 
 @pytest.fixture
-def observation_missing_content() -> str:
-    """Load observation with all missing values."""
-    return (FIXTURES_DIR / "46025_missing.txt").read_text()
+def observation_missing_content(load_fixture: Callable[[str], str]) -> str:
+    """Observation for 46025 with every value missing."""
+    return load_fixture("ndbc/46025_missing.txt")
 
 
 @pytest.fixture
-def observation_partial_content() -> str:
-    """Load observation with some missing values."""
-    return (FIXTURES_DIR / "46025_partial.txt").read_text()
+def observation_partial_content(load_fixture: Callable[[str], str]) -> str:
+    """Observation for 46025 with some values missing."""
+    return load_fixture("ndbc/46025_partial.txt")
 
 
 @pytest.fixture
-def station_page_content() -> str:
-    """Load station page fixture."""
-    return (FIXTURES_DIR / "station_page_46025.html").read_text()
+def station_page_content(load_fixture: Callable[[str], str]) -> str:
+    """Station page HTML for 46025."""
+    return load_fixture("ndbc/station_page_46025.html")
 
 
 class TestParseStationTable:
@@ -80,6 +82,10 @@ class TestParseStationTable:
         stations = ndbc_client._parse_station_table(content)
         assert stations == []
 
+    def test_station_id_pattern_precompiled(self):
+        """Test the station ID pattern is compiled once at module scope."""
+        assert isinstance(ndbc.STATION_ID_RE, re.Pattern)
+
 
 class TestParseObservation:
     def test_parse_valid_observation(self, ndbc_client: NDBCClient, observation_content: str):
@@ -132,6 +138,25 @@ class TestParseObservation:
         # Visibility: 5.0 NM * 1852 = 9260 m
         assert obs.visibility_m == 5.0 * 1852
 
+    def test_parse_observation_bytes(self, ndbc_client: NDBCClient, observation_content: str):
+        """Test parsing raw bytes gives the same observation as text."""
+        from_text = ndbc_client._parse_realtime_observation("46025", observation_content)
+        from_bytes = ndbc_client._parse_realtime_observation(
+            "46025", observation_content.encode("ascii")
+        )
+
+        assert from_text is not None
+        assert from_bytes is not None
+        assert from_bytes.model_dump(exclude={"ingested_at"}) == from_text.model_dump(
+            exclude={"ingested_at"}
+        )
+
+    def test_parse_bytes_headers_only(self, ndbc_client: NDBCClient):
+        """Test parsing bytes with only headers returns None."""
+        content = b"#YY  MM DD hh mm WDIR\n#yr  mo dy hr mn degT\n"
+        obs = ndbc_client._parse_realtime_observation("46025", content)
+        assert obs is None
+
     def test_parse_empty_content(self, ndbc_client: NDBCClient):
         """Test parsing empty content returns None."""
         obs = ndbc_client._parse_realtime_observation("46025", "")
@@ -177,71 +202,84 @@ class TestParseStationMetadata:
         assert metadata.station_type == "buoy"
         assert metadata.owner == "NDBC"
 
+    def test_parse_station_metadata_is_cached(
+        self,
+        ndbc_client: NDBCClient,
+        station_page_content: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test parsing the same page twice only runs the page parser once."""
+        calls = 0
+        parse_page = ndbc_client._parse_station_page
+
+        def counting_parse_page(station_id: str, content: str):
+            nonlocal calls
+            calls += 1
+            return parse_page(station_id, content)
 
-class TestHTTPRequests:
-    @respx.mock
-    @pytest.mark.asyncio
-    async def test_get_active_stations(self, ndbc_client: NDBCClient, station_table_content: str):
-        """Test fetching active stations via HTTP."""
-        respx.get("https://www.ndbc.noaa.gov/data/stations/station_table.txt").mock(
-            return_value=httpx.Response(200, text=station_table_content)
-        )
+        monkeypatch.setattr(ndbc_client, "_parse_station_page", counting_parse_page)
 
-        stations = await ndbc_client.get_active_stations()
+        m1 = ndbc_client._parse_station_metadata("46025", station_page_content)
+        m2 = ndbc_client._parse_station_metadata("46025", station_page_content)
 
-        assert len(stations) == 5
-        assert "46025" in stations
+        assert calls == 1
+        assert m1 is not None and m2 is not None
+        assert m2.model_dump(exclude={"updated_at"}) == m1.model_dump(exclude={"updated_at"})
 
-    @respx.mock
-    @pytest.mark.asyncio
-    async def test_get_active_stations_http_error(self, ndbc_client: NDBCClient):
-        """Test handling HTTP error when fetching stations."""
-        respx.get("https://www.ndbc.noaa.gov/data/stations/station_table.txt").mock(
-            return_value=httpx.Response(500)
+    def test_cached_station_metadata_gets_fresh_updated_at(
+        self,
+        ndbc_client: NDBCClient,
+        station_page_content: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test a cache hit is stamped with the current time, not the first parse's."""
+        times = iter(
+            [
+                datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc),
+                datetime(2024, 1, 15, 12, 10, tzinfo=timezone.utc),
+            ]
         )
 
-        stations = await ndbc_client.get_active_stations()
+        class _SteppingDatetime(datetime):
+            @classmethod
+            def now(cls, tz: tzinfo | None = None) -> datetime:  # type: ignore[override]
+                return next(times)
 
-        assert stations == []
+        monkeypatch.setattr(ndbc, "datetime", _SteppingDatetime)
 
-    @respx.mock
-    @pytest.mark.asyncio
-    async def test_get_latest_observation(self, ndbc_client: NDBCClient, observation_content: str):
-        """Test fetching latest observation via HTTP."""
-        respx.get("https://www.ndbc.noaa.gov/data/realtime2/46025.txt").mock(
-            return_value=httpx.Response(200, text=observation_content)
-        )
+        m1 = ndbc_client._parse_station_metadata("46025", station_page_content)
+        m2 = ndbc_client._parse_station_metadata("46025", station_page_content)
 
-        obs = await ndbc_client.get_latest_observation("46025")
+        assert m1 is not None and m2 is not None
+        assert m2.updated_at > m1.updated_at
 
-        assert obs is not None
-        assert obs.source_station_id == "46025"
-        assert obs.wind_speed_mps == 5.1
+    def test_parse_station_metadata_reparses_changed_page(
+        self, ndbc_client: NDBCClient, station_page_content: str
+    ):
+        """Test a changed page is parsed again rather than served from cache."""
+        m1 = ndbc_client._parse_station_metadata("46025", station_page_content)
+        changed = station_page_content.replace("Santa Monica Basin", "Renamed Buoy")
+        m2 = ndbc_client._parse_station_metadata("46025", changed)
 
-    @respx.mock
-    @pytest.mark.asyncio
-    async def test_get_latest_observation_404(self, ndbc_client: NDBCClient):
-        """Test handling 404 when fetching observation."""
-        respx.get("https://www.ndbc.noaa.gov/data/realtime2/99999.txt").mock(
-            return_value=httpx.Response(404)
-        )
+        assert m2 is not None
+        assert m2 is not m1
+        assert m2.name == "Renamed Buoy - 46025"
 
-        obs = await ndbc_client.get_latest_observation("99999")
-
-        assert obs is None
 
+class TestHTTPRequests:
     @respx.mock
-    @pytest.mark.asyncio
-    async def test_get_observations_batch(self, ndbc_client: NDBCClient, observation_content: str):
+    async def test_get_observations_batch(
+        self, ndbc_client: NDBCClient, http_response: Callable[..., httpx.Response]
+    ):
         """Test fetching multiple observations in batch."""
         respx.get("https://www.ndbc.noaa.gov/data/realtime2/46025.txt").mock(
-            return_value=httpx.Response(200, text=observation_content)
+            return_value=http_response(200, "ndbc/46025.txt")
         )
         respx.get("https://www.ndbc.noaa.gov/data/realtime2/46026.txt").mock(
-            return_value=httpx.Response(200, text=observation_content)
+            return_value=http_response(200, "ndbc/46025.txt")
         )
         respx.get("https://www.ndbc.noaa.gov/data/realtime2/99999.txt").mock(
-            return_value=httpx.Response(404)
+            return_value=http_response(404)
         )
 
         observations = await ndbc_client.get_observations_batch(["46025", "46026", "99999"])
@@ -249,7 +287,31 @@ class TestHTTPRequests:
         assert len(observations) == 2
 
     @respx.mock
-    @pytest.mark.asyncio
+    async def test_get_observations_batch_is_concurrent(
+        self, ndbc_client: NDBCClient, http_response: Callable[..., httpx.Response]
+    ):
+        """Test that batch requests are in flight at the same time."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_response(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return http_response(200, "ndbc/46025.txt")
+
+        respx.get(url__regex=r"https://www\.ndbc\.noaa\.gov/data/realtime2/.*\.txt").mock(
+            side_effect=slow_response
+        )
+
+        observations = await ndbc_client.get_observations_batch(["46025", "46026", "46027"])
+
+        assert len(observations) == 3
+        assert peak == 3
+
+    @respx.mock
     async def test_client_close(self, ndbc_config: NDBCConfig):
         """Test client close method."""
         client = NDBCClient(config=ndbc_config)
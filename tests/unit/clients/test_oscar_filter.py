@@ -0,0 +1,59 @@
+"""Unit tests for OSCAR client station filtering."""
+
+from collections.abc import Callable
+
+import pytest
+
+from weather_station_db.clients.oscar import OSCARClient, OSCARStation
+
+
+class TestFilterStations:
+    @pytest.mark.parametrize(
+        "criteria,expected_count,predicate",
+        [
+            pytest.param(
+                {"territories": ["United States of America"]},
+                2,
+                lambda s: s.territory == "United States of America",
+                id="territory",
+            ),
+            pytest.param(
+                {"station_classes": ["synoptic"]},
+                3,
+                lambda s: s.station_class == "synoptic",
+                id="station_class",
+            ),
+            pytest.param(
+                {"facility_types": ["Sea fixed"]},
+                1,
+                lambda s: s.facility_type == "Sea fixed",
+                id="facility_type",
+            ),
+            pytest.param(
+                {"station_classes": ["SYNOPTIC"]},
+                3,
+                lambda s: s.station_class == "synoptic",
+                id="case_insensitive",
+            ),
+            pytest.param(
+                {"territories": ["United States of America"], "station_classes": ["synoptic"]},
+                2,
+                lambda s: s.territory == "United States of America"
+                and s.station_class == "synoptic",
+                id="multiple_criteria",
+            ),
+        ],
+    )
+    def test_filter_stations(
+        self,
+        oscar_client: OSCARClient,
+        parsed_stations: list[OSCARStation],
+        criteria: dict[str, list[str]],
+        expected_count: int,
+        predicate: Callable[[OSCARStation], bool],
+    ):
+        """Test filtering stations by each criterion and combinations of them."""
+        filtered = oscar_client.filter_stations(parsed_stations, **criteria)
+
+        assert len(filtered) == expected_count
+        assert all(predicate(s) for s in filtered)
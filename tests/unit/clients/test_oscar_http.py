@@ -0,0 +1,174 @@
+"""Unit tests for OSCAR client HTTP requests."""
+
+import json
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from typing import Any
+
+import httpx
+import pytest
+import pytest_asyncio
+import respx
+
+from tests.fixtures.oscar import data as oscar_data
+from weather_station_db.clients.oscar import OSCARClient
+from weather_station_db.config import OSCARConfig
+
+BASE_URL = "https://oscar.wmo.int/surface/rest/api"
+SEARCH_URL = f"{BASE_URL}/search/station"
+STATION_DETAIL_URL = f"{BASE_URL}/stations/station"
+STATION_DETAIL_URL_PATTERN = re.compile(rf"{re.escape(STATION_DETAIL_URL)}/.+")
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _search_page(stations: list) -> bytes:
+    """Serialize a single-page OSCAR search response."""
+    return json.dumps(
+        {
+            "totalCount": len(stations),
+            "pageCount": 1,
+            "pageNumber": 1,
+            "itemsPerPage": 50000,
+            "stationSearchResults": stations,
+        }
+    ).encode()
+
+
+# Shared by every test, like the http_response fixture in conftest.py
+APPROVED_SEARCH_RESPONSE = httpx.Response(
+    200, content=_search_page(oscar_data.APPROVED_STATIONS), headers=JSON_HEADERS
+)
+SEARCH_RESULTS_RESPONSE = httpx.Response(
+    200,
+    content=_search_page(oscar_data.SEARCH_RESULTS["stationSearchResults"]),
+    headers=JSON_HEADERS,
+)
+STATION_DETAIL_RESPONSE = httpx.Response(
+    200, content=json.dumps(oscar_data.STATION_DETAIL).encode(), headers=JSON_HEADERS
+)
+NOT_FOUND_RESPONSE = httpx.Response(404)
+SERVER_ERROR_RESPONSE = httpx.Response(500)
+
+# (route, response, client call, requested URL without query, result check)
+HTTP_SCENARIOS = [
+    pytest.param(
+        "search",
+        APPROVED_SEARCH_RESPONSE,
+        lambda client: client.get_all_stations(),
+        SEARCH_URL,
+        lambda result: len(result) == 5,
+        id="get_all_stations",
+    ),
+    pytest.param(
+        "search",
+        SERVER_ERROR_RESPONSE,
+        lambda client: client.get_all_stations(use_cache=False),
+        SEARCH_URL,
+        lambda result: result == [],
+        id="get_all_stations_http_error",
+    ),
+    pytest.param(
+        "search",
+        SEARCH_RESULTS_RESPONSE,
+        lambda client: client.search_stations(
+            territory="United States of America", station_class="synoptic"
+        ),
+        SEARCH_URL,
+        # Filtered results depend on fixture data matching criteria
+        lambda result: isinstance(result, list),
+        id="search_stations",
+    ),
+    pytest.param(
+        "detail",
+        STATION_DETAIL_RESPONSE,
+        lambda client: client.get_station_detail("0-20000-0-72053"),
+        f"{STATION_DETAIL_URL}/0-20000-0-72053",
+        lambda result: result is not None
+        and result.wigos_id == "0-20000-0-72053"
+        and result.name == "NEW YORK CITY CENTRAL PARK",
+        id="get_station_detail",
+    ),
+    pytest.param(
+        "detail",
+        NOT_FOUND_RESPONSE,
+        lambda client: client.get_station_detail("invalid"),
+        f"{STATION_DETAIL_URL}/invalid",
+        lambda result: result is None,
+        id="get_station_detail_404",
+    ),
+]
+
+
+@pytest_asyncio.fixture(scope="class")
+async def shared_oscar_client(oscar_config: OSCARConfig) -> AsyncIterator[OSCARClient]:
+    """One OSCAR client, and its httpx client, for every test in a class."""
+    client = OSCARClient(config=oscar_config)
+    yield client
+    await client.close()
+
+
+@pytest.fixture(scope="class", autouse=True)
+def respx_router() -> Iterator[respx.MockRouter]:
+    """One respx router with the OSCAR routes registered once per test class."""
+    with respx.mock(assert_all_called=False) as router:
+        router.get(SEARCH_URL, name="search")
+        router.get(url__regex=STATION_DETAIL_URL_PATTERN, name="detail")
+        yield router
+
+
+@pytest.fixture
+def routes(respx_router: respx.MockRouter) -> Iterator[respx.MockRouter]:
+    """The class router, with call history reset after each test."""
+    yield respx_router
+    respx_router.reset()
+
+
+class TestHTTPRequests:
+    @pytest.fixture
+    def oscar_client(self, shared_oscar_client: OSCARClient) -> OSCARClient:
+        """The class-shared client with its station cache emptied."""
+        shared_oscar_client._station_cache = None
+        return shared_oscar_client
+
+    @pytest.mark.parametrize("route,response,call,url,check", HTTP_SCENARIOS)
+    async def test_request(
+        self,
+        routes: respx.MockRouter,
+        oscar_client: OSCARClient,
+        route: str,
+        response: httpx.Response,
+        call: Callable[[OSCARClient], Awaitable[Any]],
+        url: str,
+        check: Callable[[Any], bool],
+    ):
+        """Test a client request against a mocked OSCAR response."""
+        routes[route].mock(return_value=response)
+
+        assert check(await call(oscar_client))
+        # The detail route matches any station ID, so check the one requested
+        requested = routes[route].calls.last.request.url
+        assert requested.copy_with(query=None) == httpx.URL(url)
+
+    async def test_get_all_stations_caches(
+        self, routes: respx.MockRouter, oscar_client: OSCARClient
+    ):
+        """Test that station list is cached."""
+        route = routes["search"].mock(return_value=APPROVED_SEARCH_RESPONSE)
+
+        # First call
+        stations1 = await oscar_client.get_all_stations()
+        # Second call should use cache
+        stations2 = await oscar_client.get_all_stations()
+
+        assert len(stations1) == len(stations2)
+        assert route.call_count == 1
+
+    async def test_client_close(self, oscar_config: OSCARConfig):
+        """Test client close method."""
+        client = OSCARClient(config=oscar_config)
+
+        # Access http_client to initialize it
+        _ = client.http_client
+
+        await client.close()
+        assert client._http_client is None
@@ -0,0 +1,87 @@
+"""Unit tests for OSCAR station to StationMetadata conversion."""
+
+import pytest
+
+from weather_station_db.clients.oscar import OSCARClient, OSCARStation
+from weather_station_db.schemas import DataSource
+
+
+@pytest.fixture
+def sample_oscar_station() -> OSCARStation:
+    """Sample OSCAR station for testing."""
+    return OSCARStation(
+        wigos_id="0-20000-0-72053",
+        name="NEW YORK CITY CENTRAL PARK",
+        latitude=40.779,
+        longitude=-73.969,
+        elevation_m=47.5,
+        country_code="US",
+        territory="United States of America",
+        region="North America",
+        station_class="synoptic",
+        facility_type="Land fixed",
+        owner="National Weather Service",
+        status="operational",
+    )
+
+
+class TestToStationMetadata:
+    def test_convert_valid_station(
+        self, oscar_client: OSCARClient, sample_oscar_station: OSCARStation
+    ):
+        """Test converting OSCARStation to StationMetadata."""
+        metadata = oscar_client.to_station_metadata(sample_oscar_station)
+
+        assert metadata is not None
+        assert metadata.source == DataSource.OSCAR
+        assert metadata.source_station_id == "0-20000-0-72053"
+        assert metadata.wmo_id == "0-20000-0-72053"
+        assert metadata.name == "NEW YORK CITY CENTRAL PARK"
+        assert metadata.latitude == 40.779
+        assert metadata.longitude == -73.969
+        assert metadata.elevation_m == 47.5
+        assert metadata.country_code == "US"
+        assert metadata.station_type == "synoptic"
+        assert metadata.owner == "National Weather Service"
+
+    def test_convert_station_class_mapping(self, oscar_client: OSCARClient):
+        """Test station class is mapped correctly."""
+        station = OSCARStation(
+            wigos_id="test",
+            name="Test",
+            latitude=0,
+            longitude=0,
+            elevation_m=None,
+            country_code=None,
+            territory=None,
+            region=None,
+            station_class="upperAir",
+            facility_type=None,
+            owner=None,
+            status=None,
+        )
+
+        metadata = oscar_client.to_station_metadata(station)
+
+        assert metadata is not None
+        assert metadata.station_type == "upper_air"
+
+    def test_convert_missing_coords_returns_none(self, oscar_client: OSCARClient):
+        """Test conversion returns None for missing coordinates."""
+        station = OSCARStation(
+            wigos_id="test",
+            name="Test",
+            latitude=None,
+            longitude=None,
+            elevation_m=None,
+            country_code=None,
+            territory=None,
+            region=None,
+            station_class=None,
+            facility_type=None,
+            owner=None,
+            status=None,
+        )
+
+        metadata = oscar_client.to_station_metadata(station)
+        assert metadata is None
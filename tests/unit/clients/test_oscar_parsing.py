@@ -0,0 +1,124 @@
+"""Unit tests for OSCAR client response parsing."""
+
+import json
+from collections.abc import Callable
+
+import pytest
+
+from tests.fixtures.oscar import data as oscar_data
+from weather_station_db.clients.oscar import OSCARClient, OSCARStation
+
+
+@pytest.mark.parametrize(
+    "name,filename",
+    [
+        ("APPROVED_STATIONS", "approved_stations_sample.json"),
+        ("STATION_DETAIL", "station_detail_sample.json"),
+        ("SEARCH_RESULTS", "search_results_sample.json"),
+        ("STATION_MISSING_COORDS", "station_missing_coords.json"),
+    ],
+)
+def test_fixture_data_matches_json(name: str, filename: str, load_fixture: Callable[[str], str]):
+    """Test the Python fixture literals match their JSON source files."""
+    assert getattr(oscar_data, name) == json.loads(load_fixture(f"oscar/{filename}"))
+
+
+class TestOSCARStationFromAPIResponse:
+    def test_from_valid_response(self, station_detail_data: dict):
+        """Test creating OSCARStation from valid API response."""
+        station = OSCARStation.from_api_response(station_detail_data)
+
+        assert station is not None
+        assert station.wigos_id == "0-20000-0-72053"
+        assert station.name == "NEW YORK CITY CENTRAL PARK"
+        assert station.latitude == 40.779
+        assert station.longitude == -73.969
+        assert station.elevation_m == 47.5
+        assert station.country_code == "US"
+        assert station.territory == "United States of America"
+        assert station.station_class == "synoptic"
+        assert station.facility_type == "Land fixed"
+        assert station.owner == "National Weather Service"
+
+    def test_from_response_missing_coords(self, station_missing_coords_data: dict):
+        """Test creating OSCARStation with missing coordinates."""
+        station = OSCARStation.from_api_response(station_missing_coords_data)
+
+        assert station is not None
+        assert station.wigos_id == "0-99999-0-00000"
+        assert station.latitude is None
+        assert station.longitude is None
+
+    def test_from_response_no_wigos_id(self):
+        """Test returns None when no WIGOS ID."""
+        data = {"name": "Test Station", "latitude": 0, "longitude": 0}
+        station = OSCARStation.from_api_response(data)
+        assert station is None
+
+    def test_from_response_uses_wigos_id_fallback(self):
+        """Test uses wigosId when wigosStationIdentifier missing."""
+        data = {
+            "wigosId": "0-20000-0-72053",
+            "name": "Test Station",
+            "latitude": 40.0,
+            "longitude": -74.0,
+        }
+        station = OSCARStation.from_api_response(data)
+
+        assert station is not None
+        assert station.wigos_id == "0-20000-0-72053"
+
+    def test_from_response_extracts_from_nested_wigos_identifiers(self):
+        """Test extracts WIGOS ID from nested wigosStationIdentifiers array."""
+        data = {
+            "name": "Test Station",
+            "latitude": 40.0,
+            "longitude": -74.0,
+            "wigosStationIdentifiers": [
+                {"wigosStationIdentifier": "0-20000-0-72053", "primary": True}
+            ],
+        }
+        station = OSCARStation.from_api_response(data)
+
+        assert station is not None
+        assert station.wigos_id == "0-20000-0-72053"
+
+
+class TestParseStationList:
+    def test_parse_list_format(self, oscar_client: OSCARClient, approved_stations_data: list):
+        """Test parsing station list in array format."""
+        stations = oscar_client._parse_station_list(approved_stations_data)
+
+        assert len(stations) == 5
+        assert stations[0].wigos_id == "0-20000-0-72053"
+        assert stations[0].name == "NEW YORK CITY CENTRAL PARK"
+
+    def test_parse_search_results_format(
+        self, oscar_client: OSCARClient, search_results_data: dict
+    ):
+        """Test parsing station list in search results format."""
+        stations = oscar_client._parse_station_list(search_results_data)
+
+        assert len(stations) == 2
+        assert stations[0].wigos_id == "0-20000-0-72053"
+
+    def test_parse_filters_missing_coords(self, oscar_client: OSCARClient):
+        """Test that stations without coords are filtered."""
+        data = [
+            {"wigosStationIdentifier": "valid", "latitude": 0, "longitude": 0},
+            {"wigosStationIdentifier": "invalid", "latitude": None, "longitude": None},
+        ]
+        stations = oscar_client._parse_station_list(data)
+
+        assert len(stations) == 1
+        assert stations[0].wigos_id == "valid"
+
+    def test_parse_empty_list(self, oscar_client: OSCARClient):
+        """Test parsing empty list."""
+        stations = oscar_client._parse_station_list([])
+        assert stations == []
+
+    def test_parse_invalid_data(self, oscar_client: OSCARClient):
+        """Test parsing invalid data."""
+        stations = oscar_client._parse_station_list("not a list or dict")
+        assert stations == []
@@ -4,7 +4,7 @@ import pytest
 from datetime import datetime, timezone
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_observation_data() -> dict:
     """Valid observation data matching the Observation schema."""
     return {
@@ -32,7 +32,7 @@ def sample_observation_data() -> dict:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_station_metadata() -> dict:
     """Valid station metadata matching the StationMetadata schema."""
     return {
@@ -0,0 +1,114 @@
+"""Shared fixtures for producer tests."""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from weather_station_db.config import CSVConfig, KafkaConfig
+from weather_station_db.outputs import OutputManager
+from weather_station_db.schemas import DataSource, Observation, StationMetadata
+
+from .stubs import CountingSink
+
+
+@pytest.fixture(scope="session")
+def csv_config() -> CSVConfig:
+    """CSV configuration for testing."""
+    return CSVConfig(enabled=False)
+
+
+@pytest.fixture(scope="session")
+def kafka_config() -> KafkaConfig:
+    """Kafka configuration for testing."""
+    return KafkaConfig(
+        enabled=False,
+        bootstrap_servers="localhost:9092",
+        metadata_topic="test.station.metadata",
+        observation_topic="test.observation.raw",
+    )
+
+
+@pytest.fixture(scope="session")
+def _output_manager_template() -> Mock:
+    """OutputManager mock built once and handed back to each test."""
+    return Mock(spec_set=OutputManager)
+
+
+@pytest.fixture
+def mock_output_manager(_output_manager_template: Mock) -> Mock:
+    """Mock OutputManager with call history and configured results cleared."""
+    _output_manager_template.reset_mock(return_value=True, side_effect=True)
+    return _output_manager_template
+
+
+@pytest.fixture
+def sink() -> CountingSink:
+    """Fresh counting OutputManager stand-in."""
+    return CountingSink()
+
+
+@pytest.fixture(scope="session")
+def isd_sample_observation() -> Observation:
+    """Sample ISD observation, built without validation."""
+    return Observation.model_construct(
+        source=DataSource.ISD,
+        source_station_id="720534-00164",
+        observed_at=datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc),
+        air_temp_c=15.2,
+        wind_speed_mps=5.1,
+        wind_direction_deg=270,
+        pressure_hpa=1018.5,
+        visibility_m=16000.0,
+        ingested_at=datetime(2024, 1, 15, 12, 5, tzinfo=timezone.utc),
+    )
+
+
+@pytest.fixture(scope="session")
+def isd_sample_metadata() -> StationMetadata:
+    """Sample ISD station metadata, built without validation."""
+    return StationMetadata.model_construct(
+        source=DataSource.ISD,
+        source_station_id="720534-00164",
+        name="NEW YORK CITY CENTRAL PARK",
+        latitude=40.779,
+        longitude=-73.969,
+        elevation_m=47.5,
+        country_code="US",
+        state_province="NY",
+        station_type="synoptic",
+        owner="NOAA",
+        updated_at=datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc),
+    )
+
+
+@pytest.fixture(scope="session")
+def ndbc_sample_observation() -> Observation:
+    """Sample NDBC observation, built without validation."""
+    return Observation.model_construct(
+        source=DataSource.NDBC,
+        source_station_id="46025",
+        observed_at=datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc),
+        air_temp_c=15.2,
+        wind_speed_mps=5.1,
+        wind_direction_deg=270,
+        wave_height_m=1.8,
+        water_temp_c=14.8,
+        ingested_at=datetime(2024, 1, 15, 12, 5, tzinfo=timezone.utc),
+    )
+
+
+@pytest.fixture(scope="session")
+def ndbc_sample_metadata() -> StationMetadata:
+    """Sample NDBC station metadata, built without validation."""
+    return StationMetadata.model_construct(
+        source=DataSource.NDBC,
+        source_station_id="46025",
+        name="Santa Monica Basin",
+        latitude=33.749,
+        longitude=-119.053,
+        elevation_m=0.0,
+        station_type="buoy",
+        owner="NDBC",
+        updated_at=datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc),
+    )
@@ -0,0 +1,88 @@
+"""Lightweight client stand-ins for producer tests."""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any
+
+Call = tuple[tuple[Any, ...], dict[str, Any]]
+
+
+class StubClient:
+    """Client stand-in that returns canned results and records every call.
+
+    Arguments of each call are appended to ``calls[method_name]`` as an
+    ``(args, kwargs)`` tuple, so tests can assert on them with plain equality.
+    """
+
+    def __init__(
+        self,
+        *,
+        stations: Iterable[Any] = (),
+        filtered: Iterable[Any] | None = None,
+        active_stations: Iterable[str] = (),
+        observations: Iterable[Any] = (),
+        metadata: Iterable[Any] = (),
+    ) -> None:
+        self.stations = list(stations)
+        self.filtered = None if filtered is None else list(filtered)
+        self.active_stations = list(active_stations)
+        self.observations = list(observations)
+        self.metadata = list(metadata)
+        self.calls: defaultdict[str, list[Call]] = defaultdict(list)
+
+    def _record(self, name: str, *args: Any, **kwargs: Any) -> None:
+        self.calls[name].append((args, kwargs))
+
+    async def get_station_list(self, *args: Any, **kwargs: Any) -> list[Any]:
+        self._record("get_station_list", *args, **kwargs)
+        return self.stations
+
+    async def get_all_stations(self, *args: Any, **kwargs: Any) -> list[Any]:
+        self._record("get_all_stations", *args, **kwargs)
+        return self.stations
+
+    async def search_stations(self, *args: Any, **kwargs: Any) -> list[Any]:
+        self._record("search_stations", *args, **kwargs)
+        return self.stations
+
+    def filter_stations(self, stations: list[Any], *args: Any, **kwargs: Any) -> list[Any]:
+        """Return ``filtered`` if given, otherwise the stations passed in."""
+        self._record("filter_stations", stations, *args, **kwargs)
+        return stations if self.filtered is None else self.filtered
+
+    async def get_active_stations(self, *args: Any, **kwargs: Any) -> list[str]:
+        self._record("get_active_stations", *args, **kwargs)
+        return self.active_stations
+
+    async def get_observations_batch(self, *args: Any, **kwargs: Any) -> list[Any]:
+        self._record("get_observations_batch", *args, **kwargs)
+        return self.observations
+
+    async def get_metadata_batch(self, *args: Any, **kwargs: Any) -> list[Any]:
+        self._record("get_metadata_batch", *args, **kwargs)
+        return self.metadata
+
+    async def close(self) -> None:
+        self._record("close")
+
+
+class CountingSink:
+    """OutputManager stand-in that keeps written records and counts flushes."""
+
+    def __init__(self) -> None:
+        self.observations: list[Any] = []
+        self.metadata: list[Any] = []
+        self.flushes = 0
+        self.closes = 0
+
+    def write_observation(self, observation: Any) -> None:
+        self.observations.append(observation)
+
+    def write_metadata(self, metadata: Any) -> None:
+        self.metadata.append(metadata)
+
+    def flush(self) -> None:
+        self.flushes += 1
+
+    def close(self) -> None:
+        self.closes += 1
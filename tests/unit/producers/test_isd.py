@@ -4,35 +4,44 @@ Note: ISD is now metadata-only. Observation functionality was removed.
 Use NWS or Open-Meteo producers for real-time observations.
 """
 
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from collections.abc import Iterator
+from datetime import datetime, timezone, tzinfo
+from unittest.mock import Mock
 
 import pytest
 
 from weather_station_db.clients.isd import ISDStation
 from weather_station_db.config import CSVConfig, ISDConfig, KafkaConfig
 from weather_station_db.producers.isd import ISDProducer
-from weather_station_db.schemas import DataSource, Observation, StationMetadata
+from weather_station_db.schemas import StationMetadata
 
+from .stubs import CountingSink, StubClient
 
-@pytest.fixture
-def csv_config() -> CSVConfig:
-    """CSV configuration for testing."""
-    return CSVConfig(enabled=False)
+# Read-only config variants, validated once at import
+TWO_STATIONS_CONFIG = ISDConfig(station_ids="720534-00164,725090-14732")
+COUNTRIES_CONFIG = ISDConfig(country_codes="US,CA")
+ONE_STATION_CONFIG = ISDConfig(station_ids="720534-00164")
 
+FROZEN_NOW = datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc)
 
-@pytest.fixture
-def kafka_config() -> KafkaConfig:
-    """Kafka configuration for testing."""
-    return KafkaConfig(
-        enabled=False,
-        bootstrap_servers="localhost:9092",
-        metadata_topic="test.station.metadata",
-        observation_topic="test.observation.raw",
-    )
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns FROZEN_NOW."""
+
+    @classmethod
+    def now(cls, tz: tzinfo | None = None) -> datetime:  # type: ignore[override]
+        return FROZEN_NOW if tz is None else FROZEN_NOW.astimezone(tz)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _frozen_now() -> Iterator[None]:
+    """Pin datetime.now() inside the ISD producer for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("weather_station_db.producers.isd.datetime", _FrozenDatetime)
+        yield
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def isd_config() -> ISDConfig:
     """ISD configuration for testing."""
     return ISDConfig(
@@ -45,18 +54,7 @@ def isd_config() -> ISDConfig:
     )
 
 
-@pytest.fixture
-def mock_output_manager() -> MagicMock:
-    """Mock OutputManager."""
-    manager = MagicMock()
-    manager.write_observation = MagicMock()
-    manager.write_metadata = MagicMock()
-    manager.flush = MagicMock()
-    manager.close = MagicMock()
-    return manager
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_stations() -> list[ISDStation]:
     """Sample stations for testing."""
     return [
@@ -87,40 +85,6 @@ def sample_stations() -> list[ISDStation]:
     ]
 
 
-@pytest.fixture
-def sample_observation() -> Observation:
-    """Sample observation for testing."""
-    return Observation(
-        source=DataSource.ISD,
-        source_station_id="720534-00164",
-        observed_at=datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc),
-        air_temp_c=15.2,
-        wind_speed_mps=5.1,
-        wind_direction_deg=270,
-        pressure_hpa=1018.5,
-        visibility_m=16000.0,
-        ingested_at=datetime(2024, 1, 15, 12, 5, tzinfo=timezone.utc),
-    )
-
-
-@pytest.fixture
-def sample_metadata() -> StationMetadata:
-    """Sample station metadata for testing."""
-    return StationMetadata(
-        source=DataSource.ISD,
-        source_station_id="720534-00164",
-        name="NEW YORK CITY CENTRAL PARK",
-        latitude=40.779,
-        longitude=-73.969,
-        elevation_m=47.5,
-        country_code="US",
-        state_province="NY",
-        station_type="synoptic",
-        owner="NOAA",
-        updated_at=datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc),
-    )
-
-
 class TestISDProducerInit:
     def test_init_with_defaults(self):
         """Test producer initializes with default configs."""
@@ -147,184 +111,158 @@ class TestISDProducerInit:
 
 
 class TestISDProducerPublish:
-    def test_publish_observation(
-        self,
-        csv_config: CSVConfig,
-        kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
-        sample_observation: Observation,
-    ):
-        """Test publishing observation via OutputManager."""
-        producer = ISDProducer(
-            csv_config=csv_config,
-            kafka_config=kafka_config,
-            output_manager=mock_output_manager,
-        )
-
-        producer.publish_observation(sample_observation)
-
-        mock_output_manager.write_observation.assert_called_once_with(sample_observation)
-
-    def test_publish_station_metadata(
+    @pytest.mark.parametrize(
+        "producer_method,payload_fixture,sink_method",
+        [
+            ("publish_observation", "isd_sample_observation", "write_observation"),
+            ("publish_station_metadata", "isd_sample_metadata", "write_metadata"),
+        ],
+    )
+    def test_forwards_to_output_manager(
         self,
+        request: pytest.FixtureRequest,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
-        sample_metadata: StationMetadata,
+        mock_output_manager: Mock,
+        producer_method: str,
+        payload_fixture: str,
+        sink_method: str,
     ):
-        """Test publishing station metadata via OutputManager."""
+        """Test each publish call is forwarded to the matching OutputManager method."""
         producer = ISDProducer(
             csv_config=csv_config,
             kafka_config=kafka_config,
             output_manager=mock_output_manager,
         )
+        payload = request.getfixturevalue(payload_fixture)
 
-        producer.publish_station_metadata(sample_metadata)
+        getattr(producer, producer_method)(payload)
 
-        mock_output_manager.write_metadata.assert_called_once_with(sample_metadata)
+        getattr(mock_output_manager, sink_method).assert_called_once_with(payload)
 
 
 class TestISDProducerRunOnce:
-    @pytest.mark.asyncio
     async def test_run_once_with_configured_stations(
         self,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
+        sink: CountingSink,
         sample_stations: list[ISDStation],
-        sample_metadata: StationMetadata,
+        isd_sample_metadata: StationMetadata,
     ):
         """Test run_once with configured station IDs (metadata-only)."""
-        isd_config = ISDConfig(station_ids="720534-00164,725090-14732")
-
-        mock_client = AsyncMock()
-        mock_client.get_station_list = AsyncMock(return_value=sample_stations)
-        mock_client.filter_stations = MagicMock(return_value=sample_stations)
-        mock_client.get_metadata_batch = AsyncMock(return_value=[sample_metadata])
+        client = StubClient(stations=sample_stations, metadata=[isd_sample_metadata])
 
         producer = ISDProducer(
-            client=mock_client,
+            client=client,
             csv_config=csv_config,
             kafka_config=kafka_config,
-            isd_config=isd_config,
-            output_manager=mock_output_manager,
+            isd_config=TWO_STATIONS_CONFIG,
+            output_manager=sink,
         )
 
         await producer.run_once()
 
-        mock_client.get_station_list.assert_called_once()
-        mock_client.filter_stations.assert_called_once()
-        mock_client.get_metadata_batch.assert_called_once()
+        assert len(client.calls["get_station_list"]) == 1
+        assert len(client.calls["filter_stations"]) == 1
+        assert len(client.calls["get_metadata_batch"]) == 1
 
         # Should have published metadata only (ISD is metadata-only now)
-        mock_output_manager.write_metadata.assert_called_once()
+        assert len(sink.metadata) == 1
 
-    @pytest.mark.asyncio
     async def test_run_once_with_country_filter(
         self,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
+        sink: CountingSink,
         sample_stations: list[ISDStation],
-        sample_metadata: StationMetadata,
+        isd_sample_metadata: StationMetadata,
     ):
         """Test run_once with country code filter."""
-        isd_config = ISDConfig(country_codes="US,CA")
-
-        mock_client = AsyncMock()
-        mock_client.get_station_list = AsyncMock(return_value=sample_stations)
-        mock_client.filter_stations = MagicMock(return_value=sample_stations)
-        mock_client.get_metadata_batch = AsyncMock(return_value=[sample_metadata])
+        client = StubClient(stations=sample_stations, metadata=[isd_sample_metadata])
 
         producer = ISDProducer(
-            client=mock_client,
+            client=client,
             csv_config=csv_config,
             kafka_config=kafka_config,
-            isd_config=isd_config,
-            output_manager=mock_output_manager,
+            isd_config=COUNTRIES_CONFIG,
+            output_manager=sink,
         )
 
         await producer.run_once()
 
         # Check that filter_stations was called with country_codes
-        filter_call = mock_client.filter_stations.call_args
-        assert filter_call.kwargs.get("country_codes") == ["US", "CA"]
+        [(_, filter_kwargs)] = client.calls["filter_stations"]
+        assert filter_kwargs.get("country_codes") == ["US", "CA"]
+        assert filter_kwargs.get("active_year") == FROZEN_NOW.year
 
-    @pytest.mark.asyncio
     async def test_run_once_no_stations(
         self,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
         isd_config: ISDConfig,
-        mock_output_manager: MagicMock,
+        sink: CountingSink,
     ):
         """Test run_once handles empty station list."""
-        mock_client = AsyncMock()
-        mock_client.get_station_list = AsyncMock(return_value=[])
-        mock_client.filter_stations = MagicMock(return_value=[])
+        client = StubClient()
 
         producer = ISDProducer(
-            client=mock_client,
+            client=client,
             csv_config=csv_config,
             kafka_config=kafka_config,
             isd_config=isd_config,
-            output_manager=mock_output_manager,
+            output_manager=sink,
         )
 
         await producer.run_once()
 
-        mock_client.get_metadata_batch.assert_not_called()
-        mock_output_manager.write_metadata.assert_not_called()
+        assert client.calls["get_metadata_batch"] == []
+        assert sink.metadata == []
 
-    @pytest.mark.asyncio
     async def test_run_once_flushes_messages(
         self,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
+        sink: CountingSink,
         sample_stations: list[ISDStation],
-        sample_metadata: StationMetadata,
+        isd_sample_metadata: StationMetadata,
     ):
         """Test run_once flushes messages after publishing."""
-        isd_config = ISDConfig(station_ids="720534-00164")
-
-        mock_client = AsyncMock()
-        mock_client.get_station_list = AsyncMock(return_value=sample_stations)
-        mock_client.filter_stations = MagicMock(return_value=sample_stations[:1])
-        mock_client.get_metadata_batch = AsyncMock(return_value=[sample_metadata])
+        client = StubClient(
+            stations=sample_stations, filtered=sample_stations[:1], metadata=[isd_sample_metadata]
+        )
 
         producer = ISDProducer(
-            client=mock_client,
+            client=client,
             csv_config=csv_config,
             kafka_config=kafka_config,
-            isd_config=isd_config,
-            output_manager=mock_output_manager,
+            isd_config=ONE_STATION_CONFIG,
+            output_manager=sink,
         )
 
         await producer.run_once()
 
-        mock_output_manager.flush.assert_called_once()
+        assert sink.flushes == 1
 
 
 class TestISDProducerClose:
-    @pytest.mark.asyncio
     async def test_close_closes_client(
         self,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
+        sink: CountingSink,
     ):
         """Test close method closes the client."""
-        mock_client = AsyncMock()
+        client = StubClient()
 
         producer = ISDProducer(
-            client=mock_client,
+            client=client,
             csv_config=csv_config,
             kafka_config=kafka_config,
-            output_manager=mock_output_manager,
+            output_manager=sink,
         )
 
         await producer.close()
 
-        mock_client.close.assert_called_once()
-        mock_output_manager.close.assert_called_once()
+        assert len(client.calls["close"]) == 1
+        assert sink.closes == 1
@@ -1,33 +1,21 @@
 """Unit tests for NDBC producer."""
 
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import Mock
 
 import pytest
 
 from weather_station_db.config import CSVConfig, KafkaConfig, NDBCConfig
 from weather_station_db.producers.ndbc import NDBCProducer
-from weather_station_db.schemas import DataSource, Observation, StationMetadata
+from weather_station_db.schemas import Observation, StationMetadata
 
+from .stubs import CountingSink, StubClient
 
-@pytest.fixture
-def csv_config() -> CSVConfig:
-    """CSV configuration for testing."""
-    return CSVConfig(enabled=False)
+TWO_STATIONS_CONFIG = NDBCConfig(station_ids="46025,46026")
+ALL_STATIONS_CONFIG = NDBCConfig(station_ids="")
+ONE_STATION_CONFIG = NDBCConfig(station_ids="46025")
 
 
-@pytest.fixture
-def kafka_config() -> KafkaConfig:
-    """Kafka configuration for testing."""
-    return KafkaConfig(
-        enabled=False,
-        bootstrap_servers="localhost:9092",
-        metadata_topic="test.station.metadata",
-        observation_topic="test.observation.raw",
-    )
-
-
-@pytest.fixture
+@pytest.fixture(scope="session")
 def ndbc_config() -> NDBCConfig:
     """NDBC configuration for testing."""
     return NDBCConfig(
@@ -38,49 +26,6 @@ def ndbc_config() -> NDBCConfig:
     )
 
 
-@pytest.fixture
-def mock_output_manager() -> MagicMock:
-    """Mock OutputManager."""
-    manager = MagicMock()
-    manager.write_observation = MagicMock()
-    manager.write_metadata = MagicMock()
-    manager.flush = MagicMock()
-    manager.close = MagicMock()
-    return manager
-
-
-@pytest.fixture
-def sample_observation() -> Observation:
-    """Sample observation for testing."""
-    return Observation(
-        source=DataSource.NDBC,
-        source_station_id="46025",
-        observed_at=datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc),
-        air_temp_c=15.2,
-        wind_speed_mps=5.1,
-        wind_direction_deg=270,
-        wave_height_m=1.8,
-        water_temp_c=14.8,
-        ingested_at=datetime(2024, 1, 15, 12, 5, tzinfo=timezone.utc),
-    )
-
-
-@pytest.fixture
-def sample_metadata() -> StationMetadata:
-    """Sample station metadata for testing."""
-    return StationMetadata(
-        source=DataSource.NDBC,
-        source_station_id="46025",
-        name="Santa Monica Basin",
-        latitude=33.749,
-        longitude=-119.053,
-        elevation_m=0.0,
-        station_type="buoy",
-        owner="NDBC",
-        updated_at=datetime(2024, 1, 15, 12, 0, tzinfo=timezone.utc),
-    )
-
-
 class TestNDBCProducerInit:
     def test_init_with_defaults(self):
         """Test producer initializes with default configs."""
@@ -107,200 +52,160 @@ class TestNDBCProducerInit:
 
 
 class TestNDBCProducerPublish:
-    def test_publish_observation(
-        self,
-        csv_config: CSVConfig,
-        kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
-        sample_observation: Observation,
-    ):
-        """Test publishing observation via OutputManager."""
-        producer = NDBCProducer(
-            csv_config=csv_config,
-            kafka_config=kafka_config,
-            output_manager=mock_output_manager,
-        )
-
-        producer.publish_observation(sample_observation)
-
-        mock_output_manager.write_observation.assert_called_once_with(sample_observation)
-
-    def test_publish_station_metadata(
-        self,
-        csv_config: CSVConfig,
-        kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
-        sample_metadata: StationMetadata,
-    ):
-        """Test publishing station metadata via OutputManager."""
-        producer = NDBCProducer(
-            csv_config=csv_config,
-            kafka_config=kafka_config,
-            output_manager=mock_output_manager,
-        )
-
-        producer.publish_station_metadata(sample_metadata)
-
-        mock_output_manager.write_metadata.assert_called_once_with(sample_metadata)
-
-    def test_flush_calls_output_manager_flush(
+    @pytest.mark.parametrize(
+        "producer_method,payload_fixture,sink_method",
+        [
+            ("publish_observation", "ndbc_sample_observation", "write_observation"),
+            ("publish_station_metadata", "ndbc_sample_metadata", "write_metadata"),
+            ("flush", None, "flush"),
+        ],
+    )
+    def test_forwards_to_output_manager(
         self,
+        request: pytest.FixtureRequest,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
+        mock_output_manager: Mock,
+        producer_method: str,
+        payload_fixture: str | None,
+        sink_method: str,
     ):
-        """Test flush calls underlying OutputManager flush."""
+        """Test each publish call is forwarded to the matching OutputManager method."""
         producer = NDBCProducer(
             csv_config=csv_config,
             kafka_config=kafka_config,
             output_manager=mock_output_manager,
         )
+        args = (request.getfixturevalue(payload_fixture),) if payload_fixture else ()
 
-        producer.flush()
+        getattr(producer, producer_method)(*args)
 
-        mock_output_manager.flush.assert_called_once()
+        getattr(mock_output_manager, sink_method).assert_called_once_with(*args)
 
 
 class TestNDBCProducerRunOnce:
-    @pytest.mark.asyncio
     async def test_run_once_with_configured_stations(
         self,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
-        sample_observation: Observation,
-        sample_metadata: StationMetadata,
+        sink: CountingSink,
+        ndbc_sample_observation: Observation,
+        ndbc_sample_metadata: StationMetadata,
     ):
         """Test run_once with configured station IDs."""
-        ndbc_config = NDBCConfig(station_ids="46025,46026")
-
-        mock_client = AsyncMock()
-        mock_client.get_observations_batch = AsyncMock(return_value=[sample_observation])
-        mock_client.get_metadata_batch = AsyncMock(return_value=[sample_metadata])
+        client = StubClient(observations=[ndbc_sample_observation], metadata=[ndbc_sample_metadata])
 
         producer = NDBCProducer(
-            client=mock_client,
+            client=client,
             csv_config=csv_config,
             kafka_config=kafka_config,
-            ndbc_config=ndbc_config,
-            output_manager=mock_output_manager,
+            ndbc_config=TWO_STATIONS_CONFIG,
+            output_manager=sink,
         )
 
         await producer.run_once()
 
         # Should not call get_active_stations when station_ids configured
-        mock_client.get_active_stations.assert_not_called()
-        mock_client.get_observations_batch.assert_called_once_with(["46025", "46026"])
-        mock_client.get_metadata_batch.assert_called_once_with(["46025", "46026"])
+        assert client.calls["get_active_stations"] == []
+        assert client.calls["get_observations_batch"] == [((["46025", "46026"],), {})]
+        assert client.calls["get_metadata_batch"] == [((["46025", "46026"],), {})]
 
         # Should have published observation and metadata
-        mock_output_manager.write_observation.assert_called_once()
-        mock_output_manager.write_metadata.assert_called_once()
+        assert len(sink.observations) == 1
+        assert len(sink.metadata) == 1
 
-    @pytest.mark.asyncio
     async def test_run_once_fetches_all_stations(
         self,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
-        sample_observation: Observation,
-        sample_metadata: StationMetadata,
+        sink: CountingSink,
+        ndbc_sample_observation: Observation,
+        ndbc_sample_metadata: StationMetadata,
     ):
         """Test run_once fetches all active stations when none configured."""
-        ndbc_config = NDBCConfig(station_ids="")
-
-        mock_client = AsyncMock()
-        mock_client.get_active_stations = AsyncMock(return_value=["46025", "46026", "46027"])
-        mock_client.get_observations_batch = AsyncMock(return_value=[sample_observation])
-        mock_client.get_metadata_batch = AsyncMock(return_value=[sample_metadata])
+        client = StubClient(
+            active_stations=["46025", "46026", "46027"],
+            observations=[ndbc_sample_observation],
+            metadata=[ndbc_sample_metadata],
+        )
 
         producer = NDBCProducer(
-            client=mock_client,
+            client=client,
             csv_config=csv_config,
             kafka_config=kafka_config,
-            ndbc_config=ndbc_config,
-            output_manager=mock_output_manager,
+            ndbc_config=ALL_STATIONS_CONFIG,
+            output_manager=sink,
         )
 
         await producer.run_once()
 
-        mock_client.get_active_stations.assert_called_once()
-        mock_client.get_observations_batch.assert_called_once_with(["46025", "46026", "46027"])
+        assert len(client.calls["get_active_stations"]) == 1
+        assert client.calls["get_observations_batch"] == [((["46025", "46026", "46027"],), {})]
 
-    @pytest.mark.asyncio
     async def test_run_once_no_stations(
         self,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
+        sink: CountingSink,
     ):
         """Test run_once handles empty station list."""
-        ndbc_config = NDBCConfig(station_ids="")
-
-        mock_client = AsyncMock()
-        mock_client.get_active_stations = AsyncMock(return_value=[])
+        client = StubClient()
 
         producer = NDBCProducer(
-            client=mock_client,
+            client=client,
             csv_config=csv_config,
             kafka_config=kafka_config,
-            ndbc_config=ndbc_config,
-            output_manager=mock_output_manager,
+            ndbc_config=ALL_STATIONS_CONFIG,
+            output_manager=sink,
         )
 
         await producer.run_once()
 
-        mock_client.get_observations_batch.assert_not_called()
-        mock_output_manager.write_observation.assert_not_called()
+        assert client.calls["get_observations_batch"] == []
+        assert sink.observations == []
 
-    @pytest.mark.asyncio
     async def test_run_once_flushes_messages(
         self,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
-        sample_observation: Observation,
-        sample_metadata: StationMetadata,
+        sink: CountingSink,
+        ndbc_sample_observation: Observation,
+        ndbc_sample_metadata: StationMetadata,
     ):
         """Test run_once flushes messages after publishing."""
-        ndbc_config = NDBCConfig(station_ids="46025")
-
-        mock_client = AsyncMock()
-        mock_client.get_observations_batch = AsyncMock(return_value=[sample_observation])
-        mock_client.get_metadata_batch = AsyncMock(return_value=[sample_metadata])
+        client = StubClient(observations=[ndbc_sample_observation], metadata=[ndbc_sample_metadata])
 
         producer = NDBCProducer(
-            client=mock_client,
+            client=client,
             csv_config=csv_config,
             kafka_config=kafka_config,
-            ndbc_config=ndbc_config,
-            output_manager=mock_output_manager,
+            ndbc_config=ONE_STATION_CONFIG,
+            output_manager=sink,
         )
 
         await producer.run_once()
 
-        mock_output_manager.flush.assert_called_once()
+        assert sink.flushes == 1
 
 
 class TestNDBCProducerClose:
-    @pytest.mark.asyncio
     async def test_close_closes_client(
         self,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
+        sink: CountingSink,
     ):
         """Test close method closes the client."""
-        mock_client = AsyncMock()
+        client = StubClient()
 
         producer = NDBCProducer(
-            client=mock_client,
+            client=client,
             csv_config=csv_config,
             kafka_config=kafka_config,
-            output_manager=mock_output_manager,
+            output_manager=sink,
         )
 
         await producer.close()
 
-        mock_client.close.assert_called_once()
-        mock_output_manager.close.assert_called_once()
+        assert len(client.calls["close"]) == 1
+        assert sink.closes == 1
@@ -1,7 +1,7 @@
 """Unit tests for OSCAR producer."""
 
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import Mock
 
 import pytest
 
@@ -10,22 +10,7 @@ from weather_station_db.config import CSVConfig, KafkaConfig, OSCARConfig
 from weather_station_db.producers.oscar import OSCARProducer
 from weather_station_db.schemas import DataSource, StationMetadata
 
-
-@pytest.fixture
-def csv_config() -> CSVConfig:
-    """CSV configuration for testing."""
-    return CSVConfig(enabled=False)
-
-
-@pytest.fixture
-def kafka_config() -> KafkaConfig:
-    """Kafka configuration for testing."""
-    return KafkaConfig(
-        enabled=False,
-        bootstrap_servers="localhost:9092",
-        metadata_topic="test.station.metadata",
-        observation_topic="test.observation.raw",
-    )
+from .stubs import CountingSink, StubClient
 
 
 @pytest.fixture
@@ -40,21 +25,10 @@ def oscar_config() -> OSCARConfig:
     )
 
 
-@pytest.fixture
-def mock_output_manager() -> MagicMock:
-    """Mock OutputManager."""
-    manager = MagicMock()
-    manager.write_observation = MagicMock()
-    manager.write_metadata = MagicMock()
-    manager.flush = MagicMock()
-    manager.close = MagicMock()
-    return manager
-
-
-@pytest.fixture
-def sample_oscar_stations() -> list[OSCARStation]:
-    """Sample OSCAR stations for testing."""
-    return [
+@pytest.fixture(scope="session")
+def sample_oscar_stations() -> tuple[OSCARStation, ...]:
+    """Sample OSCAR stations for testing (shared, read-only)."""
+    return (
         OSCARStation(
             wigos_id="0-20000-0-72053",
             name="NEW YORK CITY CENTRAL PARK",
@@ -83,10 +57,10 @@ def sample_oscar_stations() -> list[OSCARStation]:
             owner="National Weather Service",
             status="operational",
         ),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_metadata() -> StationMetadata:
     """Sample station metadata for testing."""
     return StationMetadata(
@@ -134,7 +108,7 @@ class TestOSCARProducerPublish:
         self,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
+        mock_output_manager: Mock,
         sample_metadata: StationMetadata,
     ):
         """Test publishing station metadata via OutputManager."""
@@ -150,168 +124,127 @@ class TestOSCARProducerPublish:
 
 
 class TestOSCARProducerRunOnce:
-    @pytest.mark.asyncio
-    async def test_run_once_all_stations(
+    @pytest.mark.parametrize(
+        "oscar_config,fetch_method,filter_calls",
+        [
+            pytest.param(
+                OSCARConfig(territories="", station_classes="", facility_types=""),
+                "get_all_stations",
+                0,
+                id="all",
+            ),
+            pytest.param(
+                OSCARConfig(territories="United States of America", station_classes=""),
+                "search_stations",
+                0,
+                id="territory",
+            ),
+            pytest.param(
+                OSCARConfig(territories="", station_classes="synoptic"),
+                "get_all_stations",
+                1,
+                id="class",
+            ),
+        ],
+    )
+    async def test_run_once(
         self,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
         oscar_config: OSCARConfig,
-        mock_output_manager: MagicMock,
-        sample_oscar_stations: list[OSCARStation],
-        sample_metadata: StationMetadata,
-    ):
-        """Test run_once fetches all stations when no filters."""
-        mock_client = AsyncMock()
-        mock_client.get_all_stations = AsyncMock(return_value=sample_oscar_stations)
-        mock_client.get_metadata_batch = AsyncMock(return_value=[sample_metadata, sample_metadata])
-
-        producer = OSCARProducer(
-            client=mock_client,
-            csv_config=csv_config,
-            kafka_config=kafka_config,
-            oscar_config=oscar_config,
-            output_manager=mock_output_manager,
-        )
-
-        await producer.run_once()
-
-        mock_client.get_all_stations.assert_called_once()
-        mock_client.get_metadata_batch.assert_called_once()
-        # Should publish 2 metadata records
-        assert mock_output_manager.write_metadata.call_count == 2
-
-    @pytest.mark.asyncio
-    async def test_run_once_with_territory_filter(
-        self,
-        csv_config: CSVConfig,
-        kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
-        sample_oscar_stations: list[OSCARStation],
+        fetch_method: str,
+        filter_calls: int,
+        sink: CountingSink,
+        sample_oscar_stations: tuple[OSCARStation, ...],
         sample_metadata: StationMetadata,
     ):
-        """Test run_once with territory filter uses search API."""
-        oscar_config = OSCARConfig(territories="United States of America")
-
-        mock_client = AsyncMock()
-        mock_client.search_stations = AsyncMock(return_value=sample_oscar_stations)
-        mock_client.filter_stations = MagicMock(return_value=sample_oscar_stations)
-        mock_client.get_metadata_batch = AsyncMock(return_value=[sample_metadata])
-
-        producer = OSCARProducer(
-            client=mock_client,
-            csv_config=csv_config,
-            kafka_config=kafka_config,
-            oscar_config=oscar_config,
-            output_manager=mock_output_manager,
+        """Test run_once picks the fetch path from the configured filters."""
+        client = StubClient(
+            stations=sample_oscar_stations, metadata=[sample_metadata, sample_metadata]
         )
 
-        await producer.run_once()
-
-        mock_client.search_stations.assert_called()
-        mock_client.get_all_stations.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_run_once_with_class_filter(
-        self,
-        csv_config: CSVConfig,
-        kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
-        sample_oscar_stations: list[OSCARStation],
-        sample_metadata: StationMetadata,
-    ):
-        """Test run_once with station class filter."""
-        oscar_config = OSCARConfig(station_classes="synoptic")
-
-        mock_client = AsyncMock()
-        mock_client.get_all_stations = AsyncMock(return_value=sample_oscar_stations)
-        mock_client.filter_stations = MagicMock(return_value=sample_oscar_stations)
-        mock_client.get_metadata_batch = AsyncMock(return_value=[sample_metadata])
-
         producer = OSCARProducer(
-            client=mock_client,
+            client=client,
             csv_config=csv_config,
             kafka_config=kafka_config,
             oscar_config=oscar_config,
-            output_manager=mock_output_manager,
+            output_manager=sink,
         )
 
         await producer.run_once()
 
-        mock_client.get_all_stations.assert_called_once()
-        mock_client.filter_stations.assert_called_once()
+        fetched = [name for name in ("get_all_stations", "search_stations") if name in client.calls]
+        assert fetched == [fetch_method]
+        assert len(client.calls[fetch_method]) == 1
+        assert len(client.calls["filter_stations"]) == filter_calls
+        assert len(sink.metadata) == 2
 
-    @pytest.mark.asyncio
     async def test_run_once_no_stations(
         self,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
         oscar_config: OSCARConfig,
-        mock_output_manager: MagicMock,
+        sink: CountingSink,
     ):
         """Test run_once handles empty station list."""
-        mock_client = AsyncMock()
-        mock_client.get_all_stations = AsyncMock(return_value=[])
+        client = StubClient()
 
         producer = OSCARProducer(
-            client=mock_client,
+            client=client,
             csv_config=csv_config,
             kafka_config=kafka_config,
             oscar_config=oscar_config,
-            output_manager=mock_output_manager,
+            output_manager=sink,
         )
 
         await producer.run_once()
 
-        mock_client.get_metadata_batch.assert_not_called()
-        mock_output_manager.write_metadata.assert_not_called()
+        assert "get_metadata_batch" not in client.calls
+        assert sink.metadata == []
 
-    @pytest.mark.asyncio
     async def test_run_once_flushes_messages(
         self,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
         oscar_config: OSCARConfig,
-        mock_output_manager: MagicMock,
-        sample_oscar_stations: list[OSCARStation],
+        sink: CountingSink,
+        sample_oscar_stations: tuple[OSCARStation, ...],
         sample_metadata: StationMetadata,
     ):
         """Test run_once flushes messages after publishing."""
-        mock_client = AsyncMock()
-        mock_client.get_all_stations = AsyncMock(return_value=sample_oscar_stations)
-        mock_client.get_metadata_batch = AsyncMock(return_value=[sample_metadata])
+        client = StubClient(stations=sample_oscar_stations, metadata=[sample_metadata])
 
         producer = OSCARProducer(
-            client=mock_client,
+            client=client,
             csv_config=csv_config,
             kafka_config=kafka_config,
             oscar_config=oscar_config,
-            output_manager=mock_output_manager,
+            output_manager=sink,
         )
 
         await producer.run_once()
 
-        mock_output_manager.flush.assert_called_once()
+        assert sink.flushes == 1
 
 
 class TestOSCARProducerClose:
-    @pytest.mark.asyncio
     async def test_close_closes_client(
         self,
         csv_config: CSVConfig,
         kafka_config: KafkaConfig,
-        mock_output_manager: MagicMock,
+        sink: CountingSink,
     ):
         """Test close method closes the client."""
-        mock_client = AsyncMock()
+        client = StubClient()
 
         producer = OSCARProducer(
-            client=mock_client,
+            client=client,
             csv_config=csv_config,
             kafka_config=kafka_config,
-            output_manager=mock_output_manager,
+            output_manager=sink,
         )
 
         await producer.close()
 
-        mock_client.close.assert_called_once()
-        mock_output_manager.close.assert_called_once()
+        assert len(client.calls["close"]) == 1
+        assert sink.closes == 1
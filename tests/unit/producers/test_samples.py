@@ -0,0 +1,15 @@
+"""Checks on the shared producer test samples."""
+
+import pytest
+
+from weather_station_db.schemas import Observation, StationMetadata
+
+
+@pytest.mark.parametrize("source", ["isd", "ndbc"])
+def test_sample_models_are_valid(request: pytest.FixtureRequest, source: str):
+    """Test the model_construct samples still pass schema validation."""
+    observation = request.getfixturevalue(f"{source}_sample_observation")
+    metadata = request.getfixturevalue(f"{source}_sample_metadata")
+
+    assert Observation.model_validate(observation.model_dump()) == observation
+    assert StationMetadata.model_validate(metadata.model_dump()) == metadata
@@ -1,15 +1,21 @@
 """Tests for Observation schema."""
 
-from datetime import datetime, timezone
+import json
+from collections.abc import Mapping
+from datetime import datetime, timedelta, timezone
+from typing import Any
 
 import pytest
 from pydantic import ValidationError
 
 from weather_station_db.schemas import DataSource, Observation
 
+EST = timezone(timedelta(hours=-5))
+PRESSURE_TENDENCIES = ("rising", "falling", "steady")
+
 
 class TestObservationValidation:
-    def test_valid_full_data(self, valid_observation_data: dict):
+    def test_valid_full_data(self, valid_observation_data: Mapping[str, Any]):
         """Test creating Observation with all fields."""
         obs = Observation(**valid_observation_data)
         assert obs.source == DataSource.NDBC
@@ -18,154 +24,107 @@ class TestObservationValidation:
         assert obs.wind_direction_deg == 270
         assert obs.wave_height_m == 1.8
 
-    def test_valid_minimal_data(self, minimal_observation_data: dict):
+    def test_valid_minimal_data(self, baseline_observation: Observation):
         """Test creating Observation with only required fields."""
-        obs = Observation(**minimal_observation_data)
+        obs = baseline_observation
         assert obs.source == DataSource.ISD
         assert obs.air_temp_c is None
         assert obs.wind_speed_mps is None
         assert obs.wave_height_m is None
 
-    def test_empty_station_id_rejected(self, minimal_observation_data: dict):
+    def test_empty_station_id_rejected(self, minimal_observation_data: Mapping[str, Any]):
         """Test that empty source_station_id is rejected."""
-        minimal_observation_data["source_station_id"] = ""
         with pytest.raises(ValidationError) as exc_info:
-            Observation(**minimal_observation_data)
-        assert "source_station_id" in str(exc_info.value)
+            Observation(**(minimal_observation_data | {"source_station_id": ""}))
+        assert any("source_station_id" in e["loc"] for e in exc_info.value.errors())
 
 
 class TestObservationFieldConstraints:
-    def test_air_temp_range(self, minimal_observation_data: dict):
-        """Test air_temp_c must be between -100 and 70."""
-        minimal_observation_data["air_temp_c"] = 71.0
-        with pytest.raises(ValidationError):
-            Observation(**minimal_observation_data)
-
-        minimal_observation_data["air_temp_c"] = -101.0
-        with pytest.raises(ValidationError):
-            Observation(**minimal_observation_data)
-
-        minimal_observation_data["air_temp_c"] = 70.0
-        obs = Observation(**minimal_observation_data)
-        assert obs.air_temp_c == 70.0
-
-    def test_humidity_range(self, minimal_observation_data: dict):
-        """Test relative_humidity_pct must be between 0 and 100."""
-        minimal_observation_data["relative_humidity_pct"] = 101.0
-        with pytest.raises(ValidationError):
-            Observation(**minimal_observation_data)
-
-        minimal_observation_data["relative_humidity_pct"] = -1.0
-        with pytest.raises(ValidationError):
-            Observation(**minimal_observation_data)
-
-        minimal_observation_data["relative_humidity_pct"] = 100.0
-        obs = Observation(**minimal_observation_data)
-        assert obs.relative_humidity_pct == 100.0
-
-    def test_pressure_range(self, minimal_observation_data: dict):
-        """Test pressure_hpa must be between 800 and 1100."""
-        minimal_observation_data["pressure_hpa"] = 1101.0
-        with pytest.raises(ValidationError):
-            Observation(**minimal_observation_data)
-
-        minimal_observation_data["pressure_hpa"] = 799.0
-        with pytest.raises(ValidationError):
-            Observation(**minimal_observation_data)
-
-    def test_wind_direction_range(self, minimal_observation_data: dict):
-        """Test wind_direction_deg must be between 0 and 360."""
-        minimal_observation_data["wind_direction_deg"] = 361
-        with pytest.raises(ValidationError):
-            Observation(**minimal_observation_data)
-
-        minimal_observation_data["wind_direction_deg"] = -1
-        with pytest.raises(ValidationError):
-            Observation(**minimal_observation_data)
-
-        minimal_observation_data["wind_direction_deg"] = 360
-        obs = Observation(**minimal_observation_data)
-        assert obs.wind_direction_deg == 360
-
-    def test_wind_speed_non_negative(self, minimal_observation_data: dict):
-        """Test wind_speed_mps must be >= 0."""
-        minimal_observation_data["wind_speed_mps"] = -0.1
-        with pytest.raises(ValidationError):
-            Observation(**minimal_observation_data)
-
-        minimal_observation_data["wind_speed_mps"] = 0.0
-        obs = Observation(**minimal_observation_data)
-        assert obs.wind_speed_mps == 0.0
-
-    def test_wave_height_non_negative(self, minimal_observation_data: dict):
-        """Test wave_height_m must be >= 0."""
-        minimal_observation_data["wave_height_m"] = -0.1
-        with pytest.raises(ValidationError):
-            Observation(**minimal_observation_data)
-
-    def test_pressure_tendency_values(self, minimal_observation_data: dict):
-        """Test pressure_tendency accepts only valid literals."""
-        for valid in ["rising", "falling", "steady"]:
-            minimal_observation_data["pressure_tendency"] = valid
-            obs = Observation(**minimal_observation_data)
-            assert obs.pressure_tendency == valid
-
-        minimal_observation_data["pressure_tendency"] = "increasing"
+    @pytest.mark.parametrize(
+        "field,bad,good",
+        [
+            pytest.param("air_temp_c", 71.0, 70.0, id="air_temp_c-high"),
+            pytest.param("air_temp_c", -101.0, -100.0, id="air_temp_c-low"),
+            pytest.param("relative_humidity_pct", 101.0, 100.0, id="humidity-high"),
+            pytest.param("relative_humidity_pct", -1.0, 0.0, id="humidity-low"),
+            pytest.param("pressure_hpa", 1101.0, 1100.0, id="pressure_hpa-high"),
+            pytest.param("pressure_hpa", 799.0, 800.0, id="pressure_hpa-low"),
+            pytest.param("wind_direction_deg", 361, 360, id="wind_direction_deg-high"),
+            pytest.param("wind_direction_deg", -1, 0, id="wind_direction_deg-low"),
+            pytest.param("wind_speed_mps", -0.1, 0.0, id="wind_speed_mps-negative"),
+            pytest.param("wave_height_m", -0.1, 0.0, id="wave_height_m-negative"),
+        ],
+    )
+    def test_field_range(
+        self, minimal_observation_data: Mapping[str, Any], field: str, bad: Any, good: Any
+    ):
+        """Test values past a field's bound are rejected and the bound itself is accepted."""
+        with pytest.raises(ValidationError) as exc_info:
+            Observation(**(minimal_observation_data | {field: bad}))
+        assert any(field in e["loc"] for e in exc_info.value.errors())
+
+        obs = Observation(**(minimal_observation_data | {field: good}))
+        assert getattr(obs, field) == good
+
+    @pytest.mark.parametrize("tendency", PRESSURE_TENDENCIES)
+    def test_pressure_tendency_valid(
+        self, minimal_observation_data: Mapping[str, Any], tendency: str
+    ):
+        """Test pressure_tendency accepts each valid literal."""
+        obs = Observation(**(minimal_observation_data | {"pressure_tendency": tendency}))
+        assert obs.pressure_tendency == tendency
+
+    def test_pressure_tendency_invalid(self, minimal_observation_data: Mapping[str, Any]):
+        """Test pressure_tendency rejects values outside the literal set."""
         with pytest.raises(ValidationError):
-            Observation(**minimal_observation_data)
+            Observation(**(minimal_observation_data | {"pressure_tendency": "increasing"}))
 
 
 class TestObservationTimezone:
-    def test_observed_at_requires_utc(self, minimal_observation_data: dict):
-        """Test that observed_at requires UTC timezone."""
-        minimal_observation_data["observed_at"] = datetime(2024, 1, 15, 11, 0, 0)
-        with pytest.raises(ValidationError) as exc_info:
-            Observation(**minimal_observation_data)
-        assert "UTC" in str(exc_info.value)
-
-    def test_ingested_at_requires_utc(self, minimal_observation_data: dict):
-        """Test that ingested_at requires UTC timezone."""
-        minimal_observation_data["ingested_at"] = datetime(2024, 1, 15, 11, 5, 0)
-        with pytest.raises(ValidationError) as exc_info:
-            Observation(**minimal_observation_data)
-        assert "UTC" in str(exc_info.value)
-
-    def test_non_utc_timezone_rejected(self, minimal_observation_data: dict):
-        """Test that non-UTC timezone is rejected."""
-        from datetime import timedelta
-
-        est = timezone(timedelta(hours=-5))
-        minimal_observation_data["observed_at"] = datetime(2024, 1, 15, 11, 0, 0, tzinfo=est)
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            pytest.param("observed_at", datetime(2024, 1, 15, 11, 0, 0), id="observed_at-naive"),
+            pytest.param("ingested_at", datetime(2024, 1, 15, 11, 5, 0), id="ingested_at-naive"),
+            pytest.param(
+                "observed_at",
+                datetime(2024, 1, 15, 11, 0, 0, tzinfo=EST),
+                id="observed_at-est",
+            ),
+        ],
+    )
+    def test_non_utc_rejected(
+        self, minimal_observation_data: Mapping[str, Any], field: str, value: datetime
+    ):
+        """Test that naive and non-UTC datetimes are rejected."""
         with pytest.raises(ValidationError) as exc_info:
-            Observation(**minimal_observation_data)
-        assert "UTC" in str(exc_info.value)
+            Observation(**(minimal_observation_data | {field: value}))
+        assert any("UTC" in e["msg"] for e in exc_info.value.errors())
 
 
 class TestObservationKafka:
-    def test_kafka_key(self, valid_observation_data: dict):
+    def test_kafka_key(self, valid_observation_data: Mapping[str, Any]):
         """Test Kafka key generation."""
         obs = Observation(**valid_observation_data)
         assert obs.kafka_key() == "ndbc.46025"
 
-    def test_kafka_key_isd(self, minimal_observation_data: dict):
+    def test_kafka_key_isd(self, baseline_observation: Observation):
         """Test Kafka key for ISD source."""
-        obs = Observation(**minimal_observation_data)
-        assert obs.kafka_key() == "isd.720534-00164"
+        assert baseline_observation.kafka_key() == "isd.720534-00164"
 
-    def test_json_serialization(self, valid_observation_data: dict):
+    def test_json_serialization(self, valid_observation_data: Mapping[str, Any]):
         """Test JSON serialization for Kafka."""
         obs = Observation(**valid_observation_data)
-        json_str = obs.model_dump_json_for_kafka()
+        data = json.loads(obs.model_dump_json_for_kafka())
 
-        assert '"source":"ndbc"' in json_str
-        assert '"air_temp_c":15.2' in json_str
-        assert '"wind_direction_deg":270' in json_str
-        assert '"wave_height_m":1.8' in json_str
+        assert data["source"] == "ndbc"
+        assert data["air_temp_c"] == 15.2
+        assert data["wind_direction_deg"] == 270
+        assert data["wave_height_m"] == 1.8
 
-    def test_json_includes_null_fields(self, minimal_observation_data: dict):
+    def test_json_includes_null_fields(self, baseline_observation: Observation):
         """Test that null fields are included in JSON output."""
-        obs = Observation(**minimal_observation_data)
-        json_str = obs.model_dump_json_for_kafka()
+        data = json.loads(baseline_observation.model_dump_json_for_kafka())
 
-        assert '"air_temp_c":null' in json_str
-        assert '"wave_height_m":null' in json_str
+        assert data["air_temp_c"] is None
+        assert data["wave_height_m"] is None
@@ -1,9 +1,8 @@
 """Unit tests for main entry point."""
 
 import argparse
-from unittest.mock import AsyncMock, MagicMock, patch
-
-import pytest
+import asyncio
+from types import SimpleNamespace
 
 from weather_station_db.main import parse_args, run_producer, setup_logging
 
@@ -11,8 +10,7 @@ from weather_station_db.main import parse_args, run_producer, setup_logging
 class TestParseArgs:
     def test_default_args(self):
         """Test default argument values."""
-        with patch("sys.argv", ["weather-station-db"]):
-            args = parse_args()
+        args = parse_args([])
 
         assert args.producers is None
         assert args.once is False
@@ -20,22 +18,19 @@ class TestParseArgs:
 
     def test_producers_arg(self):
         """Test --producers argument."""
-        with patch("sys.argv", ["weather-station-db", "--producers", "ndbc", "isd"]):
-            args = parse_args()
+        args = parse_args(["--producers", "ndbc", "isd"])
 
         assert args.producers == ["ndbc", "isd"]
 
     def test_once_flag(self):
         """Test --once flag."""
-        with patch("sys.argv", ["weather-station-db", "--once"]):
-            args = parse_args()
+        args = parse_args(["--once"])
 
         assert args.once is True
 
     def test_log_level_arg(self):
         """Test --log-level argument."""
-        with patch("sys.argv", ["weather-station-db", "--log-level", "DEBUG"]):
-            args = parse_args()
+        args = parse_args(["--log-level", "DEBUG"])
 
         assert args.log_level == "DEBUG"
 
@@ -51,48 +46,45 @@ class TestSetupLogging:
         setup_logging("DEBUG")
 
 
+class DummyProducer:
+    """Producer stand-in that counts calls and can signal shutdown.
+
+    When given a shutdown event, run_once sets it on the ``stop_after``-th call.
+    """
+
+    def __init__(self, shutdown_event: asyncio.Event | None = None, stop_after: int = 1) -> None:
+        self.run_once_calls = 0
+        self.close_calls = 0
+        self.shutdown_event = shutdown_event
+        self.stop_after = stop_after
+        self.ndbc_config = SimpleNamespace(fetch_interval_seconds=0)
+
+    async def run_once(self) -> None:
+        self.run_once_calls += 1
+        if self.shutdown_event is not None and self.run_once_calls >= self.stop_after:
+            self.shutdown_event.set()
+
+    async def close(self) -> None:
+        self.close_calls += 1
+
+
 class TestRunProducer:
-    @pytest.mark.asyncio
     async def test_run_producer_once(self):
         """Test running producer once."""
-        import asyncio
+        producer = DummyProducer()
 
-        mock_producer = AsyncMock()
-        mock_producer.run_once = AsyncMock()
-        mock_producer.close = AsyncMock()
-        mock_producer.__class__.__name__ = "MockProducer"
+        await run_producer(producer, asyncio.Event(), run_once=True)
 
-        shutdown_event = asyncio.Event()
-
-        await run_producer(mock_producer, shutdown_event, run_once=True)
-
-        mock_producer.run_once.assert_called_once()
-        mock_producer.close.assert_called_once()
+        assert producer.run_once_calls == 1
+        assert producer.close_calls == 1
 
-    @pytest.mark.asyncio
     async def test_run_producer_continuous_until_shutdown(self):
         """Test running producer continuously until shutdown."""
-        import asyncio
-
-        mock_producer = AsyncMock()
-        mock_producer.run_once = AsyncMock()
-        mock_producer.close = AsyncMock()
-        mock_producer.__class__.__name__ = "MockProducer"
-        mock_producer.ndbc_config = MagicMock()
-        mock_producer.ndbc_config.fetch_interval_seconds = 1
-
         shutdown_event = asyncio.Event()
+        # A zero interval times out immediately; stop on the second run
+        producer = DummyProducer(shutdown_event, stop_after=2)
 
-        # Schedule shutdown after a short delay
-        async def trigger_shutdown():
-            await asyncio.sleep(0.1)
-            shutdown_event.set()
-
-        await asyncio.gather(
-            run_producer(mock_producer, shutdown_event, run_once=False),
-            trigger_shutdown(),
-        )
+        await run_producer(producer, shutdown_event, run_once=False)
 
-        # Should have run at least once
-        assert mock_producer.run_once.call_count >= 1
-        mock_producer.close.assert_called_once()
+        assert producer.run_once_calls == 2
+        assert producer.close_calls == 1